@@ -1,11 +1,33 @@
-from copy import deepcopy
 from statistics import mean
-from data import cpus, gpus, rams, storages, motherboards, psus
+from typing import Callable
+from cache import FitnessCache, ResultCache
+from catalog import GENOME_DTYPE, GENOME_LENGTH, PSU_GENE, Catalog, default_catalog
+from concurrent.futures import Executor
+from fitness import batch_fitness
+from functools import cached_property
+from history import FitnessHistory
+from parallel import evaluate_in_pool, start_worker_pool
+from selection import SELECTION_STRATEGIES, SelectionStrategy
+from timing import PhaseCallback, PhaseTimer
 from models import CPU, GPU, PSU, RAM, Computer, Motherboard, Storage, UserPreferences
+import heapq
+import math
+import numpy as np
 import random
+import threading
+import time
+
+# Recibe generación, mejor, promedio y peor aptitud y segundos transcurridos
+ProgressCallback = Callable[[int, float, float, float, float], None]
 
 
 class ComputerGenerator:
+    # Mínimo de genomas por worker para que valga la pena usar el pool
+    MIN_PARALLEL_CHUNK = 4096
+
+    # Tamaño de la caché de aptitudes cuando no se indica fitness_cache_size
+    DEFAULT_FITNESS_CACHE_SIZE = 100_000
+
     def __init__(
         self,
         population_size: int,
@@ -13,6 +35,22 @@ class ComputerGenerator:
         mutation_rate: float,
         generations: int,
         user_preferences: UserPreferences,
+        catalog: Catalog | None = None,
+        fitness_cache_size: int | None = None,
+        workers: int = 0,
+        seeding: str = "random",
+        patience: int | None = None,
+        min_diversity: float | None = None,
+        target_fitness: float | None = None,
+        time_limit: float | None = None,
+        selection: str | SelectionStrategy = "truncation",
+        deduplicate: str | None = None,
+        result_cache: ResultCache | None = None,
+        seed: int | random.Random | None = None,
+        phase_callback: PhaseCallback | None = None,
+        progress_callback: ProgressCallback | None = None,
+        progress_every: int = 1,
+        progress_interval: float = 0.0,
     ) -> None:
         self.population_size: int = population_size
         self.crossover_rate: float = crossover_rate
@@ -20,28 +58,102 @@ class ComputerGenerator:
         self.generations: int = generations
 
         self.population: list[Computer] = []
+        # Fuente de azar propia del generador: con la misma semilla se repite
+        # exactamente la misma búsqueda y varios generadores no se estorban
+        self.seed: int | None = seed if isinstance(seed, int) else None
+        self.random: random.Random = seed if isinstance(seed, random.Random) else random.Random(seed)
         self.user_preferences: UserPreferences = user_preferences
-
-        self.best_cases = []
-        self.avg_cases = []
-        self.worst_cases = []
+        # "random": cada gen al azar; "compatible": ver Catalog.compatible_genomes
+        self.seeding: str = seeding
+        self.catalog: Catalog = catalog or default_catalog()
+        # Estrategia para elegir sobrevivientes: un nombre de SELECTION_STRATEGIES
+        # o cualquier función con la misma firma
+        self.selection: SelectionStrategy = (
+            SELECTION_STRATEGIES[selection] if isinstance(selection, str) else selection
+        )
+        self.fitness_cache: FitnessCache = FitnessCache(
+            self.DEFAULT_FITNESS_CACHE_SIZE if fitness_cache_size is None else fitness_cache_size
+        )
+        # Corridas completas ya resueltas, guardadas en disco
+        self.result_cache: ResultCache | None = result_cache
+        # Hijos repetidos antes de evaluarlos: None los deja, "drop" los descarta y
+        # "replace" los cambia por genomas al azar
+        self.deduplicate: str | None = deduplicate
+        self.duplicate_rates: list[float] = []
+
+        # Con más de un worker, los hijos se evalúan en un pool de procesos
+        self.workers: int = workers
+        self.executor: Executor | None = None
+
+        # Criterios para terminar antes de agotar las generaciones (None = no aplica):
+        # generaciones sin mejorar, diversidad mínima, aptitud objetivo y segundos
+        self.patience: int | None = patience
+        self.min_diversity: float | None = min_diversity
+        self.target_fitness: float | None = target_fitness
+        self.time_limit: float | None = time_limit
+        self.stop_reason: str = ""
+        self.generations_run: int = 0
+        # Individuos evaluados (incluye los que salen de la caché)
+        self.evaluations: int = 0
+        # Tiempo de cada fase, total y por generación (ver timing.PhaseTimer)
+        self.timings: PhaseTimer = PhaseTimer(phase_callback)
+
+        # Avance de la corrida: se avisa como mucho cada `progress_every`
+        # generaciones y cada `progress_interval` segundos; sin callback no se
+        # hace nada
+        self.progress_callback: ProgressCallback | None = progress_callback
+        self.progress_every: int = progress_every
+        self.progress_interval: float = progress_interval
+        self.started: float = time.perf_counter()
+        self._last_progress: tuple[int, float] = (0, -math.inf)
+        self._cancelled: threading.Event = threading.Event()
+
+        # Mejor, promedio y peor aptitud y diversidad de cada generación
+        self.history: FitnessHistory = FitnessHistory(generations)
+
+    def numpy_rng(self) -> np.random.Generator:
+        # En este modo el azar sale de self.random; NumPy se siembra a partir de él
+        return np.random.default_rng(self.random.getrandbits(64))
 
     def generate_initial_population(self) -> None:
-        for _ in range(self.population_size):
-            cpu: CPU = random.choice(cpus)
-            gpu: GPU = random.choice(gpus)
-            ram: RAM = random.choice(rams)
-            storage: Storage = random.choice(storages)
-            motherboard: Motherboard = random.choice(motherboards)
-            psu: PSU = random.choice(psus)
-            
-            computer = Computer(cpu, gpu, ram, storage, motherboard, psu)
-            
-            fitness = self.fitness_function(computer)
-            
-            computer.fitness = fitness
-            
-            self.population.append(computer)
+        with self.timings.phase("initial_population"):
+            if self.seeding != "random":
+                population = [
+                    self.catalog.build_computer(genome)
+                    for genome in self.seed_genomes(self.numpy_rng())
+                ]
+            else:
+                population = []
+                for _ in range(self.population_size):
+                    cpu: CPU = self.random.choice(self.catalog.cpus)
+                    gpu: GPU = self.random.choice(self.catalog.gpus)
+                    ram: RAM = self.random.choice(self.catalog.rams)
+                    storage: Storage = self.random.choice(self.catalog.storages)
+                    motherboard: Motherboard = self.random.choice(self.catalog.motherboards)
+                    psu: PSU = self.random.choice(self.catalog.psus)
+                    
+                    computer = Computer(cpu, gpu, ram, storage, motherboard, psu)
+                    
+                    population.append(computer)
+
+        with self.timings.phase("evaluation"):
+            self.evaluate_computers(population)
+        self.population.extend(population)
+        self.timings.end_generation()
+
+    def seed_genomes(self, rng: np.random.Generator) -> np.ndarray:
+        match (self.seeding):
+            case "random":
+                return self.catalog.random_genomes(self.population_size, rng)
+            case "compatible":
+                return self.catalog.compatible_genomes(
+                    self.population_size,
+                    rng,
+                    self.user_preferences.min_prince,
+                    self.user_preferences.max_price,
+                )
+            case _:
+                raise ValueError(f"Estrategia de siembra desconocida: {self.seeding}")
 
     def fitness_function(self, computer: Computer) -> int:
         """
@@ -73,6 +185,62 @@ class ComputerGenerator:
 
         return fitness_score
 
+    def cached_fitness(self, computer: Computer) -> float:
+        # Con la caché desactivada no vale la pena ni armar la llave
+        if self.fitness_cache.max_size <= 0:
+            return self.fitness_function(computer)
+
+        key = (self.catalog.genome_of(computer), self.user_preferences)
+        fitness = self.fitness_cache.get(key)
+        if fitness is None:
+            fitness = self.fitness_function(computer)
+            self.fitness_cache.put(key, fitness)
+        return fitness
+
+    def evaluate_computers(self, computers: list[Computer]) -> None:
+        self.evaluations += len(computers)
+        if not self.fills_pool(len(computers)):
+            for computer in computers:
+                computer.fitness = self.cached_fitness(computer)
+            return
+
+        # Solo viajan al pool los genomas que no están en la caché
+        use_cache = self.fitness_cache.max_size > 0
+        pending = []
+        for computer in computers:
+            key = (self.catalog.genome_of(computer), self.user_preferences)
+            fitness = self.fitness_cache.get(key) if use_cache else None
+            if fitness is None:
+                pending.append((computer, key))
+            else:
+                computer.fitness = fitness
+
+        if not self.fills_pool(len(pending)):
+            for computer, key in pending:
+                computer.fitness = self.fitness_function(computer)
+                self.fitness_cache.put(key, computer.fitness)
+            return
+
+        genomes = np.array([genome for _, (genome, _) in pending], dtype=GENOME_DTYPE)
+        for (computer, key), fitness in zip(pending, self.parallel_evaluate(genomes).tolist()):
+            computer.fitness = fitness
+            self.fitness_cache.put(key, fitness)
+
+    def fills_pool(self, count: int) -> bool:
+        # Repartir lotes pequeños entre procesos cuesta más que evaluarlos aquí
+        return self.executor is not None and count >= self.workers * self.MIN_PARALLEL_CHUNK
+
+    def parallel_evaluate(self, genomes: np.ndarray) -> np.ndarray:
+        return evaluate_in_pool(self.executor, genomes, self.workers)
+
+    @property
+    def cache_hits(self) -> int:
+        return self.fitness_cache.hits
+
+    @property
+    def cache_misses(self) -> int:
+        return self.fitness_cache.misses
+
     def is_within_price_range(self, computer: Computer) -> bool:
         return (
             self.user_preferences.min_prince
@@ -129,7 +297,7 @@ class ComputerGenerator:
             and computer.storage.type == "SSD"
             and computer.storage.capacity < 500
             and computer.gpu == None
-            and computer.cpu.integrated_graphics < 20
+            and computer.cpu.integrated_graphics_power < 20
         ):
             return 30
         return 0
@@ -211,67 +379,434 @@ class ComputerGenerator:
 
         return new_computer1, new_computer2
 
-    def pruning(self):
-        self.population = sorted(self.population, key=lambda x: x.fitness, reverse=True)
-        
-        self.population = self.population[: self.population_size]
+    def pruning(self, fitness: np.ndarray | None = None):
+        if fitness is None:
+            fitness = self.fitness_array()
 
-    def mutate(self, computer: Computer) -> Computer:
-        mutated_computer = deepcopy(computer)
+        survivors = self.selection(fitness, self.population_size, self.numpy_rng())
+        self.population = [self.population[i] for i in survivors.tolist()]
 
-        if random.uniform(0, 1) < self.mutation_rate:
-            mutated_computer.cpu = random.choice(cpus)
+    def fitness_array(self) -> np.ndarray:
+        return np.fromiter(
+            (computer.fitness for computer in self.population),
+            dtype=float,
+            count=len(self.population),
+        )
+
+    def mutate(self, computer: Computer) -> Computer:
+        # Los componentes son inmutables: el hijo apunta a las mismas instancias
+        cpu, gpu, ram, storage, motherboard = (
+            computer.cpu,
+            computer.gpu,
+            computer.ram,
+            computer.storage,
+            computer.motherboard,
+        )
 
-        if random.uniform(0, 1) < self.mutation_rate:
-            mutated_computer.gpu = random.choice(gpus + [None])
+        if self.random.uniform(0, 1) < self.mutation_rate:
+            cpu = self.random.choice(self.catalog.cpus)
 
-        if random.uniform(0, 1) < self.mutation_rate:
-            mutated_computer.ram = random.choice(rams)
+        if self.random.uniform(0, 1) < self.mutation_rate:
+            gpu = self.random.choice(self.catalog.gpus)
 
-        if random.uniform(0, 1) < self.mutation_rate:
-            mutated_computer.storage = random.choice(storages)
+        if self.random.uniform(0, 1) < self.mutation_rate:
+            ram = self.random.choice(self.catalog.rams)
 
-        if random.uniform(0, 1) < self.mutation_rate:
-            mutated_computer.motherboard = random.choice(motherboards)
+        if self.random.uniform(0, 1) < self.mutation_rate:
+            storage = self.random.choice(self.catalog.storages)
 
-        return mutated_computer
+        if self.random.uniform(0, 1) < self.mutation_rate:
+            motherboard = self.random.choice(self.catalog.motherboards)
 
-    def run(self) -> Computer:
-        self.generate_initial_population()
+        return Computer(cpu, gpu, ram, storage, motherboard, computer.psu)
 
-        for _ in range(self.generations):
+    def evolve(self) -> None:
+        with self.timings.phase("crossover"):
             children = []
             for i in range(0, self.population_size - 1, 2):
                 parent1, parent2 = self.population[i], self.population[i + 1]
-                if random.uniform(0, 1) < self.crossover_rate:
+                if self.random.uniform(0, 1) < self.crossover_rate:
                     child1, child2 = self.crossover(parent1, parent2)
                     children.extend([child1, child2])
 
+        with self.timings.phase("mutation"):
             children = [self.mutate(computer) for computer in children]
-            
-            # calcular fitness de los nuevos individuos
-            for indiv in children:
-                fitness = self.fitness_function(indiv)
-                indiv.fitness = fitness
 
-            self.population.extend(children)
-            
-            fitness_scores = sorted(self.population, key=lambda x: x.fitness, reverse=True)
+        if self.deduplicate is not None:
+            with self.timings.phase("deduplication"):
+                kept = self.unique_children(children)
+                children = [children[i] for i in kept]
+        
+        # calcular fitness de los nuevos individuos
+        with self.timings.phase("evaluation"):
+            self.evaluate_computers(children)
+
+        self.population.extend(children)
+        
+        # Estadísticas y selección de sobrevivientes en una sola pasada lineal
+        with self.timings.phase("statistics"):
+            fitness = self.fitness_array()
             
-            self.best_cases.append(fitness_scores[0])
-            print(f"mejor score: ${fitness_scores[0].fitness}")
-            # sum(persona.fitness for persona in personas_ordenadas) / len(personas_ordenadas)
-            self.avg_cases.append(sum(computer.fitness for computer in self.population)/len(self.population))
-            self.worst_cases.append(fitness_scores[-1])
+            best = int(fitness.argmax())
+            best_fitness = float(fitness[best])
+            average, worst = float(fitness.mean()), float(fitness.min())
+            # El genoma solo se guarda cuando la mejor aptitud sube
+            best_genome = None
+            if best_fitness > self.history.best_fitness:
+                best_genome = np.array(self.catalog.genome_of(self.population[best]), dtype=GENOME_DTYPE)
 
-            #if len(self.population) > self.population_size:
-            self.pruning()
+        with self.timings.phase("pruning"):
+            self.pruning(fitness)
+
+        with self.timings.phase("statistics"):
+            self.history.record(best_fitness, average, worst, self.diversity(), best_genome)
 
-            ("Last gene:")
-        for computer in self.population:
-            pass
-            (computer)
-        best_computer = max(
-            self.population, key=lambda computer: self.fitness_function(computer)
+        self.report_progress()
+        self.timings.end_generation()
+
+    def unique_children(self, children: list[Computer]) -> list[int]:
+        """
+            Índices de los hijos que pasan a evaluarse. En modo "replace" los
+            repetidos se sustituyen en la misma lista y se conservan todos.
+        """
+        seen = set(self.population)
+        duplicated = []
+        for i, computer in enumerate(children):
+            if computer in seen:
+                duplicated.append(i)
+            seen.add(computer)
+
+        self.duplicate_rates.append(len(duplicated) / len(children) if children else 0.0)
+        match (self.deduplicate):
+            case "drop":
+                duplicated_set = set(duplicated)
+                return [i for i in range(len(children)) if i not in duplicated_set]
+            case "replace":
+                genomes = self.catalog.random_genomes(len(duplicated), self.numpy_rng())
+                for i, genome in zip(duplicated, genomes):
+                    children[i] = self.catalog.build_computer(genome)
+                return list(range(len(children)))
+            case _:
+                raise ValueError(f"Modo de deduplicación desconocido: {self.deduplicate}")
+
+    def emigrants(self, count: int) -> np.ndarray:
+        best = heapq.nlargest(count, self.population, key=lambda computer: computer.fitness)
+        return np.array([self.catalog.genome_of(computer) for computer in best], dtype=GENOME_DTYPE)
+
+    def immigrate(self, genomes: np.ndarray) -> None:
+        """
+            Reemplaza a los peores individuos por los genomas que llegan de otra
+            población (modelo de islas).
+        """
+        computers = [self.catalog.build_computer(genome) for genome in genomes]
+        self.evaluate_computers(computers)
+
+        worst = heapq.nsmallest(
+            len(computers), range(len(self.population)), key=lambda i: self.population[i].fitness
         )
+        for i, computer in zip(worst, computers):
+            self.population[i] = computer
+
+    def best_computer(self) -> Computer:
+        # Cada sobreviviente ya guarda su aptitud, no hace falta recalcularla
+        best_computer = max(self.population, key=lambda computer: computer.fitness)
         return best_computer
+
+    def last_best_fitness(self) -> float:
+        return float(self.history.best[-1])
+
+    def diversity(self) -> float:
+        # Proporción de genomas distintos en la población
+        return len(set(self.population)) / len(self.population)
+
+    def report_progress(self, force: bool = False) -> None:
+        if self.progress_callback is None or not len(self.history):
+            return
+
+        generation = len(self.history)
+        now = time.perf_counter()
+        last_generation, last_time = self._last_progress
+        if generation == last_generation:
+            return
+        if not force and (
+            generation - last_generation < self.progress_every
+            or now - last_time < self.progress_interval
+        ):
+            return
+
+        self._last_progress = (generation, now)
+        self.progress_callback(
+            generation,
+            float(self.history.best[-1]),
+            float(self.history.average[-1]),
+            float(self.history.worst[-1]),
+            now - self.started,
+        )
+
+    def cancel(self) -> None:
+        """
+            Pide detener run() al terminar la generación en curso. Se puede llamar
+            desde otro hilo.
+        """
+        self._cancelled.set()
+
+    def stopping_reason(self, started: float, stagnant_generations: int) -> str:
+        if self._cancelled.is_set():
+            return "cancelled"
+        if self.target_fitness is not None and self.last_best_fitness() >= self.target_fitness:
+            return "target_fitness"
+        if self.patience is not None and stagnant_generations >= self.patience:
+            return "stagnation"
+        if self.min_diversity is not None and self.history.diversity[-1] < self.min_diversity:
+            return "diversity"
+        if self.time_limit is not None and time.perf_counter() - started >= self.time_limit:
+            return "time_limit"
+        return ""
+
+    def fitness_history(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.history.best, self.history.average, self.history.worst
+
+    def run_settings(self) -> dict | None:
+        """
+            Todo lo que determina el resultado de run(), como llave de la caché de
+            resultados. None si la corrida no se puede guardar: sin semilla o con
+            límite de tiempo no se repite igual, la versión del catálogo solo se
+            conoce para el de data.py y una selección sin nombre no se puede
+            identificar.
+        """
+        if self.seed is None or self.time_limit is not None:
+            return None
+        selection = getattr(self.selection, "__name__", None)
+        if self.catalog is not default_catalog() or selection is None:
+            return None
+
+        return {
+            "engine": type(self).__name__,
+            "usage": self.user_preferences.usage,
+            "min_price": self.user_preferences.min_prince,
+            "max_price": self.user_preferences.max_price,
+            "population_size": self.population_size,
+            "crossover_rate": self.crossover_rate,
+            "mutation_rate": self.mutation_rate,
+            "generations": self.generations,
+            "seed": self.seed,
+            "seeding": self.seeding,
+            "selection": selection,
+            "deduplicate": self.deduplicate,
+            "patience": self.patience,
+            "min_diversity": self.min_diversity,
+            "target_fitness": self.target_fitness,
+        }
+
+    def restore_run(self, genome: list[int], fitness: float, history: tuple) -> Computer:
+        self.history = FitnessHistory.from_columns(*history)
+        self.generations_run = len(self.history)
+        self.stop_reason = "cached"
+
+        best_computer = self.catalog.build_computer(genome)
+        best_computer.fitness = fitness
+        return best_computer
+
+    def run(self) -> Computer:
+        settings = self.run_settings() if self.result_cache is not None else None
+        if settings is not None:
+            cached = self.result_cache.get(settings)
+            if cached is not None:
+                return self.restore_run(*cached)
+
+        if self.workers > 1:
+            self.executor = start_worker_pool(self.workers, self.catalog, self.user_preferences)
+
+        started = self.started = time.perf_counter()
+        self._last_progress = (0, -math.inf)
+        self.stop_reason = "generations"
+        self.generations_run = 0
+        self.evaluations = 0
+        self.timings.reset()
+        self.history = FitnessHistory(self.generations)
+        try:
+            self.generate_initial_population()
+
+            best_fitness = -math.inf
+            stagnant_generations = 0
+            for _ in range(self.generations):
+                self.evolve()
+                self.generations_run += 1
+
+                if self.last_best_fitness() > best_fitness:
+                    best_fitness = self.last_best_fitness()
+                    stagnant_generations = 0
+                else:
+                    stagnant_generations += 1
+
+                reason = self.stopping_reason(started, stagnant_generations)
+                if reason:
+                    self.stop_reason = reason
+                    break
+
+            # La última generación siempre se reporta, aunque caiga entre avisos
+            self.report_progress(force=True)
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+        best_computer = self.best_computer()
+        # Una corrida cancelada no es el resultado de esos ajustes
+        if settings is not None and self.stop_reason != "cancelled":
+            self.result_cache.put(
+                settings,
+                self.catalog.genome_of(best_computer),
+                best_computer.fitness,
+                self.history.columns(),
+            )
+        return best_computer
+
+
+class IndexedComputerGenerator(ComputerGenerator):
+    """
+        Variante del generador en la que cada individuo es un genoma de 6 índices
+        (cpu, gpu, ram, storage, motherboard, psu) sobre las listas del catálogo y
+        toda la población vive en un solo arreglo (N, 6) de NumPy. Los objetos
+        Computer solo se construyen para la respuesta final.
+    """
+
+    # El hijo 1 toma de parent2 la gpu, el storage y la psu (igual que crossover)
+    CROSSOVER_MASK = np.array([False, True, False, True, False, True])
+
+    # Evaluar el arreglo completo sale más barato que consultar la caché
+    DEFAULT_FITNESS_CACHE_SIZE = 0
+
+    @cached_property
+    def rng(self) -> np.random.Generator:
+        # Se siembra a partir de self.random la primera vez que se usa
+        return np.random.default_rng(self.random.getrandbits(64))
+
+    def generate_initial_population(self) -> None:
+        with self.timings.phase("initial_population"):
+            self.population = self.seed_genomes(self.rng)
+
+        with self.timings.phase("evaluation"):
+            self.fitness = self.evaluate(self.population)
+
+        self.timings.end_generation()
+
+    def evaluate(self, genomes: np.ndarray) -> np.ndarray:
+        """
+            El kernel vectorizado cuesta menos que buscar fila por fila en la caché,
+            por eso en este modo la caché viene desactivada por defecto.
+        """
+        self.evaluations += len(genomes)
+        if self.fitness_cache.max_size <= 0:
+            return self.batch_evaluate(genomes)
+
+        keys = [(genome, self.user_preferences) for genome in map(tuple, genomes.tolist())]
+        fitness = np.array([self.fitness_cache.get(key) for key in keys], dtype=float)
+        missing = np.flatnonzero(np.isnan(fitness))
+        if len(missing):
+            fitness[missing] = self.batch_evaluate(genomes[missing])
+            for i in missing.tolist():
+                self.fitness_cache.put(keys[i], fitness[i])
+        return fitness
+
+    def batch_evaluate(self, genomes: np.ndarray) -> np.ndarray:
+        if self.fills_pool(len(genomes)):
+            return self.parallel_evaluate(genomes)
+        return batch_fitness(self.catalog, genomes, self.user_preferences)
+
+    def crossover(
+        self, parents1: np.ndarray, parents2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        children1 = np.where(self.CROSSOVER_MASK, parents2, parents1)
+        children2 = np.where(self.CROSSOVER_MASK, parents1, parents2)
+
+        return children1, children2
+
+    def mutate(self, genomes: np.ndarray) -> np.ndarray:
+        # Igual que en el modo de objetos, la psu no se muta
+        mutations = self.rng.random((len(genomes), PSU_GENE)) < self.mutation_rate
+        rows, genes = np.nonzero(mutations)
+        genomes[rows, genes] = self.rng.integers(0, self.catalog.sizes[genes])
+
+        return genomes
+
+    def numpy_rng(self) -> np.random.Generator:
+        return self.rng
+
+    def pruning(self):
+        survivors = self.selection(self.fitness, self.population_size, self.rng)
+
+        self.population = self.population[survivors]
+        self.fitness = self.fitness[survivors]
+
+    def evolve(self) -> None:
+        with self.timings.phase("crossover"):
+            pairs = self.population_size // 2
+            parents = self.population[: 2 * pairs]
+            crossed = self.rng.random(pairs) < self.crossover_rate
+
+            children1, children2 = self.crossover(parents[0::2][crossed], parents[1::2][crossed])
+            children = np.stack([children1, children2], axis=1).reshape(-1, GENOME_LENGTH)
+
+        with self.timings.phase("mutation"):
+            children = self.mutate(children)
+
+        if self.deduplicate is not None:
+            with self.timings.phase("deduplication"):
+                kept = self.unique_children(children)
+                children = children[kept]
+
+        with self.timings.phase("evaluation"):
+            children_fitness = self.evaluate(children)
+
+        self.population = np.concatenate([self.population, children])
+        self.fitness = np.concatenate([self.fitness, children_fitness])
+
+        with self.timings.phase("statistics"):
+            best = int(self.fitness.argmax())
+            best_fitness = float(self.fitness[best])
+            average, worst = float(self.fitness.mean()), float(self.fitness.min())
+            best_genome = self.population[best].copy() if best_fitness > self.history.best_fitness else None
+
+        with self.timings.phase("pruning"):
+            self.pruning()
+
+        with self.timings.phase("statistics"):
+            self.history.record(best_fitness, average, worst, self.diversity(), best_genome)
+
+        self.report_progress()
+        self.timings.end_generation()
+
+    def unique_children(self, children: np.ndarray) -> np.ndarray:
+        codes = self.catalog.encode(children)
+        unique = np.zeros(len(children), dtype=bool)
+        unique[np.unique(codes, return_index=True)[1]] = True
+        unique &= ~np.isin(codes, self.catalog.encode(self.population))
+
+        self.duplicate_rates.append(float(1 - unique.mean()) if len(children) else 0.0)
+        match (self.deduplicate):
+            case "drop":
+                return np.flatnonzero(unique)
+            case "replace":
+                children[~unique] = self.catalog.random_genomes(int((~unique).sum()), self.rng)
+                return np.arange(len(children))
+            case _:
+                raise ValueError(f"Modo de deduplicación desconocido: {self.deduplicate}")
+
+    def emigrants(self, count: int) -> np.ndarray:
+        return self.population[np.argsort(-self.fitness, kind="stable")[:count]]
+
+    def immigrate(self, genomes: np.ndarray) -> None:
+        worst = np.argsort(self.fitness, kind="stable")[: len(genomes)]
+        self.population[worst] = genomes
+        self.fitness[worst] = self.evaluate(genomes)
+
+    def best_computer(self) -> Computer:
+        best = int(np.argmax(self.fitness))
+        computer = self.catalog.build_computer(self.population[best])
+        computer.fitness = float(self.fitness[best])
+
+        return computer
+
+    def diversity(self) -> float:
+        return len(np.unique(self.catalog.encode(self.population))) / len(self.population)
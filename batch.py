@@ -0,0 +1,135 @@
+from algorithm import IndexedComputerGenerator
+from catalog import GENOME_DTYPE, GENOME_LENGTH, PSU_GENE, Catalog, default_catalog
+from fitness import batch_fitness_many
+from models import Computer, UserPreferences
+from selection import SELECTION_STRATEGIES, SelectionStrategy
+import numpy as np
+
+
+class BatchComputerGenerator:
+    """
+        Resuelve muchas solicitudes (UserPreferences) a la vez sobre un mismo
+        catálogo. Las K poblaciones viven en un solo arreglo (K, N, 6) y evolucionan
+        juntas: cruza, mutación y evaluación son una sola operación vectorizada por
+        generación para todo el lote, así que el costo de preparación se paga una
+        vez por lote y no una vez por solicitud.
+    """
+
+    def __init__(
+        self,
+        requests: list[UserPreferences],
+        population_size: int,
+        crossover_rate: float,
+        mutation_rate: float,
+        generations: int,
+        catalog: Catalog | None = None,
+        seeding: str = "random",
+        selection: str | SelectionStrategy = "truncation",
+        seed: int | None = None,
+    ) -> None:
+        self.requests: list[UserPreferences] = list(requests)
+        self.population_size: int = population_size
+        self.crossover_rate: float = crossover_rate
+        self.mutation_rate: float = mutation_rate
+        self.generations: int = generations
+        self.catalog: Catalog = catalog or default_catalog()
+        # Igual que en ComputerGenerator
+        self.seeding: str = seeding
+        self.selection: SelectionStrategy = (
+            SELECTION_STRATEGIES[selection] if isinstance(selection, str) else selection
+        )
+        # Con la misma semilla el lote repite exactamente la misma búsqueda
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+
+        self.population: np.ndarray = np.empty((len(self.requests), 0, GENOME_LENGTH), dtype=GENOME_DTYPE)
+        self.fitness: np.ndarray = np.empty((len(self.requests), 0))
+
+        # Historia por solicitud: arreglos (generaciones, K)
+        self.best_cases: list[np.ndarray] = []
+        self.avg_cases: list[np.ndarray] = []
+        self.worst_cases: list[np.ndarray] = []
+
+    def seed_genomes(self, request: UserPreferences) -> np.ndarray:
+        match (self.seeding):
+            case "random":
+                return self.catalog.random_genomes(self.population_size, self.rng)
+            case "compatible":
+                return self.catalog.compatible_genomes(
+                    self.population_size, self.rng, request.min_prince, request.max_price
+                )
+            case _:
+                raise ValueError(f"Estrategia de siembra desconocida: {self.seeding}")
+
+    def generate_initial_population(self) -> None:
+        self.population = np.stack([self.seed_genomes(request) for request in self.requests])
+        self.fitness = batch_fitness_many(self.catalog, self.population, self.requests)
+
+    def evolve(self) -> None:
+        requests = len(self.requests)
+        pairs = self.population_size // 2
+        parents = self.population[:, : 2 * pairs]
+
+        # Todas las parejas se cruzan para conservar la forma del arreglo; los hijos
+        # de las parejas que no tocaba cruzar quedan con aptitud -inf y no se eligen
+        crossed = self.rng.random((requests, pairs)) < self.crossover_rate
+        mask = IndexedComputerGenerator.CROSSOVER_MASK
+        children1 = np.where(mask, parents[:, 1::2], parents[:, 0::2])
+        children2 = np.where(mask, parents[:, 0::2], parents[:, 1::2])
+        children = np.stack([children1, children2], axis=2).reshape(requests, -1, GENOME_LENGTH)
+
+        # Igual que en los otros motores, la psu no se muta
+        mutations = self.rng.random(children.shape[:2] + (PSU_GENE,)) < self.mutation_rate
+        batch, rows, genes = np.nonzero(mutations)
+        children[batch, rows, genes] = self.rng.integers(0, self.catalog.sizes[genes])
+
+        children_fitness = batch_fitness_many(self.catalog, children, self.requests)
+        children_fitness[~np.repeat(crossed, 2, axis=1)] = -np.inf
+
+        self.population = np.concatenate([self.population, children], axis=1)
+        self.fitness = np.concatenate([self.fitness, children_fitness], axis=1)
+
+        valid = np.isfinite(self.fitness)
+        self.best_cases.append(self.fitness.max(axis=1))
+        self.avg_cases.append(np.where(valid, self.fitness, 0).sum(axis=1) / valid.sum(axis=1))
+        self.worst_cases.append(np.where(valid, self.fitness, np.inf).min(axis=1))
+
+        self.pruning(valid)
+
+    def pruning(self, valid: np.ndarray) -> None:
+        survivors = np.empty((len(self.requests), self.population_size), dtype=np.intp)
+        for request, candidates in enumerate(valid):
+            candidates = np.flatnonzero(candidates)
+            chosen = self.selection(self.fitness[request, candidates], self.population_size, self.rng)
+            survivors[request] = candidates[chosen]
+
+        self.population = np.take_along_axis(self.population, survivors[:, :, None], axis=1)
+        self.fitness = np.take_along_axis(self.fitness, survivors, axis=1)
+
+    def best_computers(self) -> list[Computer]:
+        best = np.argmax(self.fitness, axis=1)
+        computers = []
+        for request, index in enumerate(best.tolist()):
+            computer = self.catalog.build_computer(self.population[request, index])
+            computer.fitness = float(self.fitness[request, index])
+            computers.append(computer)
+
+        return computers
+
+    def fitness_history(self, request: int) -> tuple[list[float], list[float], list[float]]:
+        return (
+            [float(cases[request]) for cases in self.best_cases],
+            [float(cases[request]) for cases in self.avg_cases],
+            [float(cases[request]) for cases in self.worst_cases],
+        )
+
+    def run(self) -> list[Computer]:
+        """
+            Regresa la mejor computadora de cada solicitud, en el mismo orden que
+            `requests`.
+        """
+        self.generate_initial_population()
+
+        for _ in range(self.generations):
+            self.evolve()
+
+        return self.best_computers()
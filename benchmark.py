@@ -0,0 +1,261 @@
+from algorithm import ComputerGenerator, IndexedComputerGenerator
+from models import UserPreferences
+from pathlib import Path
+from solver import BranchAndBoundSolver
+import argparse
+import json
+import math
+import numpy as np
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Rango de precio de cada tipo de uso: el mínimo que propone la interfaz y un
+# margen de 5000 encima
+USAGE_PRICE_RANGES = {
+    "ofimática": (8000, 13000),
+    "juegos": (10000, 15000),
+    "diseño gráfico": (15000, 20000),
+    "edición de video": (18000, 23000),
+    "navegación web": (5000, 10000),
+    "educación": (8000, 13000),
+    "arquitectura": (20000, 25000),
+}
+
+# Mediana máxima, en segundos, del arranque de la interfaz que acepta --startup.
+# Todavía no se ha medido en un equipo con pantalla: es la propuesta inicial
+STARTUP_TARGET = 0.5
+
+ENGINES: dict[str, type[ComputerGenerator]] = {
+    "object": ComputerGenerator,
+    "indexed": IndexedComputerGenerator,
+}
+
+
+def build_generator(
+    engine: str,
+    usage: str,
+    population_size: int,
+    generations: int,
+    crossover_rate: float,
+    mutation_rate: float,
+    seed: int,
+) -> ComputerGenerator:
+    min_price, max_price = USAGE_PRICE_RANGES[usage]
+    return ENGINES[engine](
+        population_size,
+        crossover_rate,
+        mutation_rate,
+        generations,
+        UserPreferences(min_price=min_price, max_price=max_price, usage=usage),
+        seed=seed,
+    )
+
+
+def timed_run(generator: ComputerGenerator) -> dict:
+    """
+        Corre todas las generaciones y mide tiempo total y tiempo hasta la mejor
+        aptitud. Se recorre el ciclo aquí, sin run(), para tener el momento en
+        que aparece la mejor computadora.
+    """
+    started = time.perf_counter()
+    generator.generate_initial_population()
+
+    best_fitness = -math.inf
+    time_to_best = 0.0
+    generation_of_best = 0
+    for generation in range(1, generator.generations + 1):
+        generator.evolve()
+        if generator.last_best_fitness() > best_fitness:
+            best_fitness = generator.last_best_fitness()
+            time_to_best = time.perf_counter() - started
+            generation_of_best = generation
+    elapsed = time.perf_counter() - started
+
+    return {
+        "seconds": elapsed,
+        "evaluations": generator.evaluations,
+        "evaluations_per_second": generator.evaluations / elapsed,
+        "generations_per_second": generator.generations / elapsed,
+        "time_to_best": time_to_best,
+        "generation_of_best": generation_of_best,
+        "final_fitness": float(generator.best_computer().fitness),
+        "phases": dict(generator.timings.totals),
+    }
+
+
+def peak_memory(generator: ComputerGenerator) -> int:
+    """
+        Pico de memoria (bytes, según tracemalloc) de una corrida completa. Va
+        aparte de la medición de tiempo porque tracemalloc la vuelve mucho más lenta.
+    """
+    tracemalloc.start()
+    try:
+        generator.generate_initial_population()
+        for _ in range(generator.generations):
+            generator.evolve()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def startup_times(runs: int) -> list[float]:
+    """
+        Tiempo de arranque de la interfaz: desde lanzar `python main.py
+        --exit-on-idle` hasta su primer evento ocioso, que imprime el reloj de
+        perf_counter. No incluye el cierre del intérprete ni la carga en segundo
+        plano que sigue después. Necesita pantalla.
+    """
+    main = Path(__file__).with_name("main.py")
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, str(main), "--exit-on-idle"], capture_output=True, text=True, check=True
+        ).stdout
+        times.append(float(output.split()[-1]) - started)
+    return times
+
+
+def commit_id() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(
+    engines: list[str],
+    usages: list[str],
+    populations: list[int],
+    generations: list[int],
+    crossover_rate: float,
+    mutation_rate: float,
+    seed: int,
+    repeats: int,
+    memory: bool,
+    solver: bool,
+) -> dict:
+    optimums = {}
+    if solver:
+        for usage in usages:
+            min_price, max_price = USAGE_PRICE_RANGES[usage]
+            preferences = UserPreferences(min_price=min_price, max_price=max_price, usage=usage)
+            optimums[usage] = float(BranchAndBoundSolver(preferences).run().fitness)
+
+    results = []
+    for engine in engines:
+        for usage in usages:
+            for population_size in populations:
+                for generation_count in generations:
+                    settings = (engine, usage, population_size, generation_count, crossover_rate, mutation_rate)
+                    # La misma semilla en cada repetición: la búsqueda es idéntica y
+                    # solo cambia el tiempo; se reporta la más rápida
+                    runs = [timed_run(build_generator(*settings, seed)) for _ in range(repeats)]
+                    result = {
+                        "engine": engine,
+                        "usage": usage,
+                        "population_size": population_size,
+                        "generations": generation_count,
+                        **min(runs, key=lambda run: run["seconds"]),
+                    }
+                    if memory:
+                        result["peak_memory"] = peak_memory(build_generator(*settings, seed))
+                    if solver:
+                        result["optimum"] = optimums[usage]
+                        result["gap"] = optimums[usage] - result["final_fitness"]
+
+                    results.append(result)
+                    print(
+                        f"{engine} {usage} población={population_size} generaciones={generation_count}:"
+                        f" {result['evaluations_per_second']:.0f} evaluaciones/s,"
+                        f" aptitud {result['final_fitness']:.2f}",
+                        file=sys.stderr,
+                    )
+
+    return {
+        "commit": commit_id(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "settings": {
+            "crossover_rate": crossover_rate,
+            "mutation_rate": mutation_rate,
+            "seed": seed,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del algoritmo genético, sin interfaz gráfica")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--usages", nargs="+", choices=list(USAGE_PRICE_RANGES), default=list(USAGE_PRICE_RANGES))
+    parser.add_argument("--populations", nargs="+", type=int, default=[100, 1_000, 10_000])
+    parser.add_argument("--generations", nargs="+", type=int, default=[10, 100])
+    parser.add_argument("--crossover-rate", type=float, default=0.8)
+    parser.add_argument("--mutation-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="medir también el pico de memoria (repite cada corrida bajo tracemalloc, mucho más lenta)",
+    )
+    parser.add_argument("--solver", action="store_true", help="comparar contra el óptimo exacto")
+    parser.add_argument("--output", default="-", help="archivo JSON de salida ('-' = consola)")
+    parser.add_argument(
+        "--startup", type=int, metavar="RUNS", help="medir solo el arranque de la interfaz",
+    )
+    parser.add_argument(
+        "--startup-target", type=float, default=STARTUP_TARGET, metavar="SECONDS",
+        help=f"con --startup, terminar con código 1 si la mediana pasa de SECONDS (por defecto {STARTUP_TARGET})",
+    )
+    args = parser.parse_args()
+
+    if args.startup:
+        times = startup_times(args.startup)
+        report = {
+            "commit": commit_id(),
+            "python": platform.python_version(),
+            "startup_seconds": times,
+            "median": statistics.median(times),
+            "target": args.startup_target,
+        }
+        write_report(report, args.output)
+        # Código de salida distinto de cero si el arranque no cumple la meta
+        if report["median"] > args.startup_target:
+            sys.exit(1)
+        return
+
+    report = run_benchmark(
+        args.engines,
+        args.usages,
+        args.populations,
+        args.generations,
+        args.crossover_rate,
+        args.mutation_rate,
+        args.seed,
+        args.repeats,
+        args.memory,
+        args.solver,
+    )
+
+    write_report(report, args.output)
+
+
+def write_report(report: dict, output: str) -> None:
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if output == "-":
+        print(text)
+    else:
+        with open(output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+from catalog import data_version
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Sequence
+import json
+import sqlite3
+import threading
+
+
+class FitnessCache:
+    """
+        Caché LRU de aptitudes. La llave es el genoma (tupla de índices del
+        catálogo) junto con las preferencias del usuario, de modo que varios
+        generadores pueden compartir la misma caché. Con max_size 0 no guarda nada.
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, float] = OrderedDict()
+
+    def get(self, key: Hashable) -> float | None:
+        fitness = self._entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key: Hashable, fitness: float) -> None:
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = fitness
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+RESULTS_PATH = Path(__file__).with_name("results.sqlite")
+
+
+class ResultCache:
+    """
+        Caché persistente (SQLite) de corridas completas del algoritmo. La llave
+        son los ajustes de la corrida (ver ComputerGenerator.run_settings) y se
+        guarda la mejor computadora como índices del catálogo, su aptitud y la
+        historia de aptitudes. Si el catálogo o el algoritmo cambiaron desde la
+        última vez (ver data_version), todas las entradas se descartan al abrir
+        la caché.
+    """
+
+    def __init__(self, path: str | Path = RESULTS_PATH, version: str | None = None) -> None:
+        self.path: Path = Path(path)
+        self.version: str = version or data_version()
+        # La interfaz corre el algoritmo en otro hilo: la conexión se comparte
+        # y el candado evita que dos hilos la usen a la vez
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results"
+                " (key TEXT PRIMARY KEY, genome TEXT, fitness REAL, history TEXT)"
+            )
+            row = self._connection.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != self.version:
+                self._connection.execute("DELETE FROM results")
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,)
+                )
+
+    @staticmethod
+    def key(settings: dict) -> str:
+        return json.dumps(settings, sort_keys=True, ensure_ascii=False)
+
+    def get(self, settings: dict) -> tuple[list[int], float, tuple[list[float], ...]] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT genome, fitness, history FROM results WHERE key = ?", (self.key(settings),)
+            ).fetchone()
+        if row is None:
+            return None
+
+        genome, fitness, history = row
+        return json.loads(genome), fitness, tuple(json.loads(history))
+
+    def put(
+        self, settings: dict, genome: Sequence[int], fitness: float, history: tuple[list[float], ...]
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (
+                    self.key(settings),
+                    json.dumps([int(gene) for gene in genome]),
+                    float(fitness),
+                    json.dumps([[float(value) for value in cases] for cases in history]),
+                ),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
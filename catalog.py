@@ -0,0 +1,290 @@
+from functools import cache, cached_property
+from pathlib import Path
+import hashlib
+from models import CPU, GPU, PSU, RAM, Computer, Motherboard, Storage
+import numpy as np
+
+# Posición de cada componente dentro de un genoma
+CPU_GENE = 0
+GPU_GENE = 1
+RAM_GENE = 2
+STORAGE_GENE = 3
+MOTHERBOARD_GENE = 4
+PSU_GENE = 5
+
+GENOME_LENGTH = 6
+GENOME_DTYPE = np.int32
+
+# Archivos de los que depende el resultado de una corrida: el catálogo y el
+# motor que lo evalúa (ver data_version)
+RESULT_SOURCES = (
+    "data.py",
+    "models.py",
+    "catalog.py",
+    "fitness.py",
+    "selection.py",
+    "history.py",
+    "parallel.py",
+    "algorithm.py",
+    "cache.py",
+)
+
+
+class Catalog:
+    """
+        Listas de componentes disponibles. Un genoma es un vector de 6 índices
+        (cpu, gpu, ram, storage, motherboard, psu) sobre estas listas.
+    """
+
+    def __init__(
+        self,
+        cpus: list[CPU],
+        gpus: list[GPU | None],
+        rams: list[RAM],
+        storages: list[Storage],
+        motherboards: list[Motherboard],
+        psus: list[PSU],
+    ) -> None:
+        self._set_components(cpus, gpus, rams, storages, motherboards, psus)
+
+        # Atributos por componente para el cálculo vectorizado de la aptitud
+        self.cpu_price: np.ndarray = _column(cpus, "price")
+        self.cpu_performance: np.ndarray = _column(cpus, "performance")
+        self.cpu_power_consumption: np.ndarray = _column(cpus, "power_consumption")
+        self.cpu_has_integrated_graphics: np.ndarray = _column(cpus, "has_integrated_graphics", dtype=bool)
+        self.cpu_integrated_graphics_power: np.ndarray = _column(cpus, "integrated_graphics_power")
+        self.cpu_model: np.ndarray = np.array([str(cpu.model) for cpu in cpus])
+        self.cpu_quality: np.ndarray = (self.cpu_performance / self.cpu_price) * 100
+
+        self.gpu_present: np.ndarray = np.array([gpu is not None for gpu in gpus])
+        self.gpu_price: np.ndarray = _column(gpus, "price")
+        self.gpu_power: np.ndarray = _column(gpus, "power")
+        self.gpu_power_consumption: np.ndarray = _column(gpus, "power_consumption")
+        self.gpu_quality: np.ndarray = np.divide(
+            self.gpu_power,
+            self.gpu_price,
+            out=np.zeros(len(gpus)),
+            where=self.gpu_price != 0,
+        ) * 650
+
+        self.ram_price: np.ndarray = _column(rams, "price")
+        self.ram_capacity: np.ndarray = _column(rams, "capacity")
+        self.ram_frequency: np.ndarray = _column(rams, "frequency")
+        self.ram_type: np.ndarray = np.array([ram.type for ram in rams])
+
+        self.storage_price: np.ndarray = _column(storages, "price")
+        self.storage_capacity: np.ndarray = _column(storages, "capacity")
+        self.storage_is_ssd: np.ndarray = np.array([storage.type == "SSD" for storage in storages])
+
+        self.motherboard_price: np.ndarray = _column(motherboards, "price")
+        self.motherboard_power_consumption: np.ndarray = _column(motherboards, "power_consumption")
+        self.motherboard_max_ram_capacity: np.ndarray = _column(motherboards, "max_ram_capacity")
+        self.motherboard_max_ram_frequency: np.ndarray = _column(motherboards, "max_ram_frequency")
+        self.motherboard_ram_socket_type: np.ndarray = np.array(
+            [motherboard.ram_socket_type for motherboard in motherboards]
+        )
+
+        self.psu_price: np.ndarray = _column(psus, "price")
+        self.psu_capacity: np.ndarray = _column(psus, "capacity")
+
+        # Matrices de compatibilidad motherboard x cpu y motherboard x ram, las mismas
+        # reglas que Motherboard.is_cpu_compatible / is_ram_compatible
+        self.cpu_compatibility: np.ndarray = np.array(
+            [
+                np.isin(self.cpu_model, list(motherboard.compatible_cpu_models))
+                for motherboard in motherboards
+            ],
+            dtype=bool,
+        ).reshape(len(motherboards), len(cpus))
+        self.ram_compatibility: np.ndarray = (
+            (self.ram_type[None, :] == self.motherboard_ram_socket_type[:, None])
+            & (self.ram_frequency[None, :] <= self.motherboard_max_ram_frequency[:, None])
+            & (self.ram_capacity[None, :] <= self.motherboard_max_ram_capacity[:, None])
+        )
+
+        # Tercias (motherboard, cpu, ram) compatibles, para sembrar poblaciones
+        self.compatible_triples: np.ndarray = np.argwhere(
+            self.cpu_compatibility[:, :, None] & self.ram_compatibility[:, None, :]
+        ).astype(GENOME_DTYPE)
+
+    def _set_components(
+        self,
+        cpus: list[CPU],
+        gpus: list[GPU | None],
+        rams: list[RAM],
+        storages: list[Storage],
+        motherboards: list[Motherboard],
+        psus: list[PSU],
+    ) -> None:
+        self.cpus: list[CPU] = cpus
+        self.gpus: list[GPU | None] = gpus
+        self.rams: list[RAM] = rams
+        self.storages: list[Storage] = storages
+        self.motherboards: list[Motherboard] = motherboards
+        self.psus: list[PSU] = psus
+
+        self.components: tuple[list, ...] = (cpus, gpus, rams, storages, motherboards, psus)
+        self.sizes: np.ndarray = np.array(
+            [len(components) for components in self.components], dtype=GENOME_DTYPE
+        )
+        # Pesos para codificar cada genoma como un solo entero (base mixta)
+        self.radix: np.ndarray = np.cumprod(
+            np.concatenate([[1], self.sizes[:0:-1].astype(np.int64)])
+        )[::-1]
+        self._positions: tuple[dict[int, int], ...] = tuple(
+            {id(component): i for i, component in enumerate(components)}
+            for components in self.components
+        )
+        # Carpeta de la que se cargaron las columnas, si vienen de una instantánea
+        self.snapshot: Path | None = None
+
+    @classmethod
+    def from_columns(cls, components: tuple[list, ...], columns: dict[str, np.ndarray]) -> "Catalog":
+        """
+            Catálogo con los atributos ya calculados (ver columns), sin volver a
+            recorrer los componentes. Los arreglos se usan tal cual, así que pueden
+            ser mapas de memoria de solo lectura.
+        """
+        catalog = cls.__new__(cls)
+        catalog._set_components(*components)
+        for name, values in columns.items():
+            setattr(catalog, name, values)
+        return catalog
+
+    def columns(self) -> dict[str, np.ndarray]:
+        # Todo lo que se calcula a partir de los componentes, menos tamaños y pesos
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if isinstance(value, np.ndarray) and name not in ("sizes", "radix")
+        }
+
+    def __reduce__(self):
+        # Un catálogo de instantánea se vuelve a mapear desde disco (los procesos
+        # comparten las páginas); cualquier otro se recalcula a partir de sus
+        # componentes
+        if self.snapshot is not None:
+            from snapshot import load_snapshot
+
+            return (load_snapshot, (self.snapshot,))
+        return (Catalog, self.components)
+
+    def is_compatible(self, cpu: int, ram: int, motherboard: int) -> bool:
+        return bool(
+            self.cpu_compatibility[motherboard, cpu] and self.ram_compatibility[motherboard, ram]
+        )
+
+    def encode(self, genomes: np.ndarray) -> np.ndarray:
+        # Un entero distinto por genoma, útil para comparar o deduplicar poblaciones
+        return genomes.astype(np.int64) @ self.radix
+
+    def random_genomes(self, count: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.integers(0, self.sizes, size=(count, GENOME_LENGTH), dtype=GENOME_DTYPE)
+
+    def compatible_genomes(
+        self,
+        count: int,
+        rng: np.random.Generator,
+        min_price: float,
+        max_price: float,
+        attempts: int = 8,
+    ) -> np.ndarray:
+        """
+            Genomas con motherboard, cpu y ram compatibles. La gpu, el storage y la
+            psu se toman del primero de `attempts` sorteos que deja el precio total
+            dentro del rango o, si ninguno lo logra, del que queda más cerca.
+        """
+        if not len(self.compatible_triples):
+            return self.random_genomes(count, rng)
+
+        genomes = np.empty((count, GENOME_LENGTH), dtype=GENOME_DTYPE)
+        triples = self.compatible_triples[rng.integers(0, len(self.compatible_triples), count)]
+        motherboard, cpu, ram = triples.T
+        genomes[:, MOTHERBOARD_GENE] = motherboard
+        genomes[:, CPU_GENE] = cpu
+        genomes[:, RAM_GENE] = ram
+
+        gpu = rng.integers(0, len(self.gpus), (count, attempts))
+        storage = rng.integers(0, len(self.storages), (count, attempts))
+        psu = rng.integers(0, len(self.psus), (count, attempts))
+        price = (
+            (self.cpu_price[cpu] + self.ram_price[ram] + self.motherboard_price[motherboard])[:, None]
+            + self.gpu_price[gpu]
+            + self.storage_price[storage]
+            + self.psu_price[psu]
+        )
+        distance = np.maximum(min_price - price, 0) + np.maximum(price - max_price, 0)
+        chosen = np.argmin(distance, axis=1)
+
+        rows = np.arange(count)
+        genomes[:, GPU_GENE] = gpu[rows, chosen]
+        genomes[:, STORAGE_GENE] = storage[rows, chosen]
+        genomes[:, PSU_GENE] = psu[rows, chosen]
+
+        return genomes
+
+    def build_computer(self, genome) -> Computer:
+        return Computer(
+            *(components[int(i)] for components, i in zip(self.components, genome))
+        )
+
+    def genome_of(self, computer: Computer) -> tuple[int, ...]:
+        components = (computer.cpu, computer.gpu, computer.ram, computer.storage, computer.motherboard, computer.psu)
+        try:
+            return tuple(positions[id(component)] for positions, component in zip(self._positions, components))
+        except KeyError:
+            # Componentes iguales a los del catálogo pero no los mismos objetos (por
+            # ejemplo, los de data.py frente a los de una instantánea)
+            return tuple(
+                positions[_component_key(component)]
+                for positions, component in zip(self._value_positions, components)
+            )
+
+    @cached_property
+    def _value_positions(self) -> tuple[dict[tuple | None, int], ...]:
+        # Si data.py repite un componente, cuenta la primera aparición
+        value_positions = tuple({} for _ in self.components)
+        for positions, components in zip(value_positions, self.components):
+            for i, component in enumerate(components):
+                positions.setdefault(_component_key(component), i)
+        return value_positions
+
+
+def _component_key(component) -> tuple | None:
+    return None if component is None else (type(component), component.arguments())
+
+
+def _column(components: list, attribute: str, dtype=float) -> np.ndarray:
+    # Los huecos del catálogo (la gpu None) valen 0
+    return np.array(
+        [0 if component is None else getattr(component, attribute) for component in components],
+        dtype=dtype,
+    )
+
+
+def data_catalog() -> Catalog:
+    from data import cpus, gpus, rams, storages, motherboards, psus
+
+    return Catalog(cpus, gpus, rams, storages, motherboards, psus)
+
+
+@cache
+def default_catalog() -> Catalog:
+    # El catálogo de data.py, leído de la instantánea compilada (ver snapshot.py)
+    from snapshot import snapshot_catalog
+
+    return snapshot_catalog()
+
+
+@cache
+def data_version() -> str:
+    """
+        Huella (sha256) del contenido de RESULT_SOURCES. Cambia con cualquier
+        edición del catálogo o del algoritmo, así que sirve para invalidar
+        resultados guardados.
+    """
+    digest = hashlib.sha256()
+    for source in RESULT_SOURCES:
+        digest.update(source.encode())
+        digest.update(Path(__file__).with_name(source).read_bytes())
+    return digest.hexdigest()
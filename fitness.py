@@ -0,0 +1,151 @@
+from functools import lru_cache
+from catalog import Catalog
+from models import UserPreferences
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def usage_masks(catalog: Catalog, usage: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+        Versión vectorizada de los get_*_score de ComputerGenerator. Regresa qué
+        pares (cpu, gpu), qué rams y qué storages cumplen con el tipo de uso; una
+        computadora recibe el puntaje de uso si cumple las tres máscaras.
+    """
+    performance = catalog.cpu_performance
+    gpu_present = catalog.gpu_present
+    gpu_power = catalog.gpu_power
+    ram_capacity = catalog.ram_capacity
+    storage_capacity = catalog.storage_capacity
+    ssd = catalog.storage_is_ssd
+
+    every_cpu = np.ones(len(catalog.cpus), dtype=bool)
+    every_ram = np.ones(len(catalog.rams), dtype=bool)
+    every_storage = np.ones(len(catalog.storages), dtype=bool)
+
+    match (usage):
+        case "ofimática":
+            cpu, gpu = performance >= 10, gpu_present & (gpu_power < 30)
+            ram, storage = ram_capacity >= 8, storage_capacity > 500
+        case "juegos":
+            cpu, gpu = performance >= 64, gpu_present & (gpu_power >= 50)
+            ram, storage = ram_capacity >= 16, ssd
+        case "diseño gráfico":
+            cpu, gpu = every_cpu, gpu_present & (gpu_power >= 30)
+            ram, storage = ram_capacity >= 16, (storage_capacity > 1_000) & ssd
+        case "edición de video":
+            cpu, gpu = every_cpu, gpu_present & (gpu_power >= 30)
+            ram, storage = ram_capacity >= 32, (storage_capacity > 1_000) & ssd
+        case "navegación web":
+            cpu = (10 <= performance) & (performance <= 30) & (catalog.cpu_integrated_graphics_power < 20)
+            gpu = ~gpu_present
+            ram, storage = ram_capacity == 8, ssd & (storage_capacity < 500)
+        case "educación":
+            # Sirve una gpu modesta o, en su defecto, los gráficos integrados del cpu
+            cpu_gpu = ((30 <= performance) & (performance <= 60))[:, None] & (
+                (gpu_present & (gpu_power < 40))[None, :]
+                | catalog.cpu_has_integrated_graphics[:, None]
+            )
+            ram = (8 < ram_capacity) & (ram_capacity <= 16)
+            storage = ssd & (128 < storage_capacity) & (storage_capacity <= 500)
+            return cpu_gpu, ram, storage
+        case "arquitectura":
+            cpu, gpu = performance >= 60, gpu_present & (gpu_power >= 60)
+            ram, storage = ram_capacity >= 32, (storage_capacity > 1_000) & ssd
+        case _:
+            return np.zeros((len(catalog.cpus), len(catalog.gpus)), dtype=bool), every_ram, every_storage
+
+    return cpu[:, None] & gpu[None, :], ram, storage
+
+
+def batch_fitness(
+    catalog: Catalog, genomes: np.ndarray, user_preferences: UserPreferences
+) -> np.ndarray:
+    """
+        Evalúa toda una población de genomas (N, 6) a la vez. Da exactamente los
+        mismos puntajes que ComputerGenerator.fitness_function.
+    """
+    cpu, gpu, ram, storage, motherboard, psu = genomes.T
+    cpu_gpu_usage, ram_usage, storage_usage = usage_masks(catalog, user_preferences.usage)
+    usage = cpu_gpu_usage[cpu, gpu] & ram_usage[ram] & storage_usage[storage]
+
+    return _batch_score(catalog, genomes.T, user_preferences.min_prince, user_preferences.max_price, usage)
+
+
+def _batch_score(
+    catalog: Catalog,
+    genes: np.ndarray,
+    min_price: float | np.ndarray,
+    max_price: float | np.ndarray,
+    usage: np.ndarray,
+) -> np.ndarray:
+    # Todo el puntaje salvo el uso, que cada llamador arma con sus máscaras. Los
+    # límites de precio pueden ser escalares o arreglos que se transmiten
+    cpu, gpu, ram, storage, motherboard, psu = genes
+
+    price = (
+        catalog.cpu_price[cpu]
+        + catalog.gpu_price[gpu]
+        + catalog.ram_price[ram]
+        + catalog.storage_price[storage]
+        + catalog.motherboard_price[motherboard]
+        + catalog.psu_price[psu]
+    )
+    power_needed = (
+        catalog.cpu_power_consumption[cpu]
+        + catalog.gpu_power_consumption[gpu]
+        + catalog.motherboard_power_consumption[motherboard]
+        + 50
+    )
+    psu_capacity = catalog.psu_capacity[psu]
+
+    within_price_range = (min_price <= price) & (price <= max_price)
+    compatible = catalog.cpu_compatibility[motherboard, cpu] & catalog.ram_compatibility[motherboard, ram]
+    psu_enough = (power_needed < psu_capacity) & (psu_capacity - power_needed <= 50)
+    bottleneck = catalog.cpu_performance[cpu] - catalog.gpu_power[gpu] <= 20
+
+    fitness_score = 30.0 * within_price_range
+    fitness_score += 30 * compatible
+    fitness_score += 30 * usage
+    fitness_score += 10 * psu_enough
+    fitness_score += 10 * bottleneck
+    fitness_score += catalog.cpu_quality[cpu]
+    fitness_score += catalog.gpu_quality[gpu]
+
+    return fitness_score
+
+
+@lru_cache(maxsize=None)
+def stacked_usage_masks(
+    catalog: Catalog, usages: tuple[str, ...]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+        Las máscaras de usage_masks de varios tipos de uso apiladas en un solo
+        arreglo cada una, indexadas por la posición del uso en `usages`.
+    """
+    masks = [usage_masks(catalog, usage) for usage in usages]
+    return tuple(np.stack([mask[i] for mask in masks]) for i in range(3))
+
+
+def batch_fitness_many(
+    catalog: Catalog, genomes: np.ndarray, requests: list[UserPreferences]
+) -> np.ndarray:
+    """
+        Evalúa a la vez las poblaciones (K, N, 6) de K solicitudes distintas; la
+        población k se califica con requests[k]. Cada fila da exactamente el mismo
+        puntaje que batch_fitness con sus propias preferencias.
+    """
+    usages = tuple(dict.fromkeys(request.usage for request in requests))
+    cpu_gpu_usage, ram_usage, storage_usage = stacked_usage_masks(catalog, usages)
+    usage_ids = np.array([usages.index(request.usage) for request in requests])[:, None]
+    min_price = np.array([request.min_prince for request in requests])[:, None]
+    max_price = np.array([request.max_price for request in requests])[:, None]
+
+    genes = np.moveaxis(genomes, -1, 0)
+    cpu, gpu, ram, storage = genes[:4]
+    usage = (
+        cpu_gpu_usage[usage_ids, cpu, gpu]
+        & ram_usage[usage_ids, ram]
+        & storage_usage[usage_ids, storage]
+    )
+
+    return _batch_score(catalog, genes, min_price, max_price, usage)
@@ -1,18 +1,37 @@
-from calendar import c
-from email.policy import default
-from tkinter.ttk import Scrollbar, Treeview
-from typing import List
-from algorithm import ComputerGenerator
-from models import Computer,  UserPreferences
-from tkinter import BOTH, END, EXTENDED, LEFT, MULTIPLE, SINGLE, VERTICAL, W, Y, Label, Listbox, Entry, Button, messagebox
-import matplotlib.pyplot as plt
-import numpy as np
+from tkinter.ttk import Treeview
+from typing import TYPE_CHECKING
+from tkinter import DISABLED, END, NORMAL, SINGLE, Label, Listbox, Entry, Button, messagebox
+import math
+import queue
+import threading
+import time
+
+# NumPy, matplotlib, el algoritmo y el catálogo se cargan en segundo plano una
+# vez que la ventana ya está en pantalla (ver load_modules)
+if TYPE_CHECKING:
+    from algorithm import ComputerGenerator
+    from models import Computer
 
 class ComputerGeneratorGUI:
 
+    # Cada cuántos milisegundos se revisan los mensajes del hilo de trabajo
+    POLL_INTERVAL = 100
+    # La gráfica se redibuja como mucho cada tantos segundos y con tantos puntos
+    REDRAW_INTERVAL = 0.25
+    PLOT_POINTS = 1000
+
     def __init__(self, master):
         self.master = master
+        # Corridas repetidas con los mismos ajustes se responden desde disco; se
+        # abre junto con el catálogo
+        self.result_cache = None
+        # El algoritmo corre en otro hilo y solo se comunica por esta cola; Tk
+        # únicamente se toca desde el hilo principal
+        self.messages = queue.Queue()
+        self.generator = None
+        self.last_redraw = -math.inf
         self.setup_gui()
+        self.master.after_idle(self.start_loading)
 
     def setup_gui(self):
         self.master.title("Generador  de computadoras")
@@ -62,17 +81,29 @@ class ComputerGeneratorGUI:
             cross_over_rate = float(cross_over_rate_entry.get())
             mutation_rate = float(mutation_rate_entry.get())
             generations = int(generations_entry.get())
+            # Con semilla la corrida se puede repetir y responder desde la caché;
+            # vacía, cada corrida es distinta
+            seed = int(seed_entry.get()) if seed_entry.get().strip() else None
 
             if price_range[1] < price_range[0]:
                 messagebox.showerror('Error', 'El rango de precio no es valido')
                 return
 
             if usage_selected:
-                generator = ComputerGenerator(population_size, cross_over_rate, mutation_rate, generations, UserPreferences(min_price=price_range[0], max_price=price_range[1], usage=usage_selected))
+                from algorithm import ComputerGenerator
+                from models import UserPreferences
 
-                best_computer = generator.run()#EJECUTO
-                self.display_computer(best_computer)
-                self.graph(generator)
+                generator = ComputerGenerator(
+                    population_size, cross_over_rate, mutation_rate, generations,
+                    UserPreferences(min_price=price_range[0], max_price=price_range[1], usage=usage_selected),
+                    seeding="compatible",
+                    result_cache=self.result_cache,
+                    seed=seed,
+                    progress_callback=lambda *progress: self.messages.put(("progress", progress)),
+                    progress_interval=self.POLL_INTERVAL / 1000,
+                )
+
+                self.start_run(generator)#EJECUTO
             else:
                 messagebox.showerror('Error', 'Debe seleccionar un uso de la computadora')
 
@@ -109,6 +140,12 @@ class ComputerGeneratorGUI:
         generations_entry.insert("end", "100")
         generations_entry.grid(row=3, column=3, padx=10, pady=10)
 
+        seed_label = Label(self.master, text="Semilla:")
+        seed_label.grid(row=0, column=4, padx=10, pady=10)
+        seed_entry = Entry(self.master)
+        seed_entry.insert("end", "0")
+        seed_entry.grid(row=1, column=4, padx=10, pady=10)
+
         computer_usages = ['ofimática', 'juegos', 'diseño gráfico', 'edición de video', 'navegación web', 'educación', 'arquitectura']
 
         listbox = Listbox(self.master, selectmode=SINGLE)
@@ -117,40 +154,163 @@ class ComputerGeneratorGUI:
         listbox.grid(row=2, column=0, padx=10, pady=10)
         listbox.bind("<<ListboxSelect>>", usage_option_changed)
 
-        get_all_data_button = Button(
-            self.master, text="Generar computadora", command=execute_algorithm)
-        get_all_data_button.grid(row=3, column=0, columnspan=2, pady=10)
+        self.generate_button = Button(
+            self.master, text="Generar computadora", command=execute_algorithm, state=DISABLED)
+        self.generate_button.grid(row=3, column=0, pady=10)
+
+        self.cancel_button = Button(
+            self.master, text="Cancelar", command=self.cancel_run, state=DISABLED)
+        self.cancel_button.grid(row=3, column=1, pady=10)
+
+        self.progress_label = Label(self.master, text="Cargando catálogo...")
+        self.progress_label.grid(row=2, column=1, padx=10, pady=10)
 
 
 
 
     def run(self):
-        self.master.resizable(False, False)
         self.master.mainloop()
 
+    def start_loading(self):
+        threading.Thread(target=self.load_modules, daemon=True).start()
+        self.master.after(self.POLL_INTERVAL, self.poll_messages)
+
+    def load_modules(self):
+        # Hilo de carga: nada de Tk aquí, el resultado llega por la cola
+        try:
+            import matplotlib.backends.backend_tkagg
+            import matplotlib.figure
+            from catalog import default_catalog
+
+            default_catalog()
+        except Exception as error:
+            self.messages.put(("load_error", error))
+            return
+
+        # La caché de resultados es opcional: si no se puede abrir (por ejemplo,
+        # en una instalación de solo lectura) se corre sin ella
+        from cache import ResultCache
+        import sqlite3
+
+        try:
+            result_cache = ResultCache()
+        except (sqlite3.Error, OSError):
+            result_cache = None
+        self.messages.put(("ready", result_cache))
+
+    def setup_plot(self):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # Gráfica dentro de la ventana; se va llenando mientras corre el algoritmo
+        figure = Figure(figsize=(9, 2.5), dpi=100)
+        self.axes = figure.add_subplot()
+        self.axes.set_title("Evolución de la población")
+        self.axes.set_xlabel("Generaciones/Iteraciones")
+        self.axes.set_ylabel("Valor de aptitud")
+        self.plot_lines = (
+            self.axes.plot([], [], label="Mejores aptitud")[0],
+            self.axes.plot([], [], label="Peores aptitud")[0],
+            self.axes.plot([], [], label="Aptitud promedio")[0],
+        )
+        self.axes.legend()
+        figure.tight_layout()
+
+        self.canvas = FigureCanvasTkAgg(figure, master=self.master)
+        self.canvas.get_tk_widget().grid(row=6, column=0, columnspan=10, padx=10, pady=10, sticky="nsew")
+        # Al agrandar la ventana el espacio extra es para la gráfica
+        self.master.rowconfigure(6, weight=1)
+        self.master.columnconfigure(tuple(range(4)), weight=1)
+
+    def start_run(self, generator: "ComputerGenerator"):
+        self.generator = generator
+        self.graph(generator, force=True)
+        self.generate_button.config(state=DISABLED)
+        self.cancel_button.config(state=NORMAL)
+        self.progress_label.config(text="Ejecutando...")
+
+        threading.Thread(target=self.run_generator, args=(generator,), daemon=True).start()
+        self.master.after(self.POLL_INTERVAL, self.poll_messages)
+
+    def run_generator(self, generator: "ComputerGenerator"):
+        # Hilo de trabajo: nada de Tk aquí, todo pasa por la cola
+        try:
+            self.messages.put(("done", generator.run()))
+        except Exception as error:
+            self.messages.put(("error", error))
+
+    def poll_messages(self):
+        while True:
+            try:
+                kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+
+            match (kind):
+                case "progress":
+                    generation, best, average, worst, elapsed = payload
+                    self.progress_label.config(
+                        text=f"Generación {generation}: mejor {best:.2f}, promedio {average:.2f} ({elapsed:.1f} s)")
+                    self.graph(self.generator)
+                case "ready":
+                    self.result_cache = payload
+                    self.setup_plot()
+                    self.generate_button.config(state=NORMAL)
+                    self.progress_label.config(text="")
+                    return
+                case "load_error":
+                    # Sin catálogo ni gráfica no se puede generar: el botón se
+                    # queda deshabilitado
+                    self.progress_label.config(text=f"No se pudo cargar el catálogo: {payload}")
+                    return
+                case "done":
+                    self.finish_run(payload)
+                    return
+                case "error":
+                    self.finish_run(None)
+                    messagebox.showerror('Error', str(payload))
+                    return
+
+        self.master.after(self.POLL_INTERVAL, self.poll_messages)
+
+    def finish_run(self, best_computer: "Computer | None"):
+        generator = self.generator
+        self.generator = None
+        self.generate_button.config(state=NORMAL)
+        self.cancel_button.config(state=DISABLED)
+        if best_computer is None:
+            return
+
+        if generator.stop_reason == "cancelled":
+            self.progress_label.config(text=f"Cancelado en la generación {generator.generations_run}")
+        self.display_computer(best_computer)
+        self.graph(generator, force=True)
+
+    def cancel_run(self):
+        # El generador se detiene al terminar la generación en curso
+        if self.generator is not None:
+            self.generator.cancel()
+            self.cancel_button.config(state=DISABLED)
+
 
     
-    def graph(self, ga: ComputerGenerator):
-        best_cases = []
-        worst_cases = []
-        avg_cases = []
-        
-        for i in range(ga.generations):
-            best_cases.append(ga.best_cases[i].fitness)
-            worst_cases.append(ga.worst_cases[i].fitness)
-            avg_cases.append(ga.avg_cases[i])
-            
-        plt.plot(np.arange(0, ga.generations), best_cases, label="Mejores aptitud")
-        plt.plot(np.arange(0, ga.generations), worst_cases, label="Peores aptitud")
-        plt.plot(np.arange(0, ga.generations), avg_cases, label="Aptitud promedio")
-        plt.legend()
-        plt.title("Evolución de la población")
-        plt.xlabel("Generaciones/Iteraciones")
-        plt.ylabel("Valor de aptitud")
-        plt.show()
-        
-    def display_computer(self, computer:Computer):
-        tree = Treeview(self.master, columns=('Modelo',))
+    def graph(self, ga: "ComputerGenerator", force: bool = False):
+        now = time.perf_counter()
+        if not force and now - self.last_redraw < self.REDRAW_INTERVAL:
+            return
+        self.last_redraw = now
+
+        # Historias largas se reducen a PLOT_POINTS puntos; la corrida puede
+        # terminar antes de agotar las generaciones
+        generations, best, average, worst = ga.history.downsampled(self.PLOT_POINTS)
+        for line, values in zip(self.plot_lines, (best, worst, average)):
+            line.set_data(generations, values)
+        self.axes.relim()
+        self.axes.autoscale_view()
+        self.canvas.draw_idle()
+
+    def display_computer(self, computer: "Computer"):
+        tree = Treeview(self.master, columns=('Modelo',), height=6)
         tree.heading('#0', text='Componentes')
         tree.heading('#1', text='Modelo')
 
@@ -0,0 +1,105 @@
+import math
+import numpy as np
+
+
+class FitnessHistory:
+    """
+        Historia de una corrida en arreglos de floats reservados de antemano: mejor,
+        promedio y peor aptitud y diversidad de cada generación. El genoma de la
+        mejor computadora solo se guarda en las generaciones en que mejora, así la
+        memoria no crece con el tamaño de la población.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._columns: np.ndarray = np.full((4, max(capacity, 1)), np.nan)
+        self.length: int = 0
+        self.best_fitness: float = -math.inf
+        # (generación, genoma) cada vez que la mejor aptitud sube
+        self.best_genomes: list[tuple[int, np.ndarray]] = []
+
+    @classmethod
+    def from_columns(
+        cls,
+        best: list[float],
+        average: list[float],
+        worst: list[float],
+        diversity: list[float] | None = None,
+    ) -> "FitnessHistory":
+        history = cls(len(best))
+        history.length = len(best)
+        history._columns[:3, : history.length] = [best, average, worst]
+        if diversity is not None:
+            history._columns[3, : history.length] = diversity
+        if history.length:
+            history.best_fitness = float(np.max(history.best))
+        return history
+
+    def record(
+        self,
+        best: float,
+        average: float,
+        worst: float,
+        diversity: float,
+        best_genome: np.ndarray | None = None,
+    ) -> None:
+        """
+            Agrega una generación. `best_genome` solo hace falta cuando `best`
+            supera a best_fitness.
+        """
+        if self.length == self._columns.shape[1]:
+            grown = np.full((4, 2 * self.length), np.nan)
+            grown[:, : self.length] = self._columns
+            self._columns = grown
+
+        self._columns[:, self.length] = (best, average, worst, diversity)
+        if best > self.best_fitness:
+            self.best_fitness = best
+            if best_genome is not None:
+                self.best_genomes.append((self.length, best_genome))
+        self.length += 1
+
+    @property
+    def best(self) -> np.ndarray:
+        return self._columns[0, : self.length]
+
+    @property
+    def average(self) -> np.ndarray:
+        return self._columns[1, : self.length]
+
+    @property
+    def worst(self) -> np.ndarray:
+        return self._columns[2, : self.length]
+
+    @property
+    def diversity(self) -> np.ndarray:
+        return self._columns[3, : self.length]
+
+    def downsampled(self, points: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+            Generaciones, mejor, promedio y peor aptitud reducidas a lo mucho
+            `points` puntos para graficar. Cada punto resume un tramo de
+            generaciones: el máximo de las mejores, el promedio de los promedios y
+            el mínimo de las peores, así la envolvente de la curva no se pierde.
+        """
+        # Se puede llamar mientras otro hilo sigue agregando generaciones: primero
+        # la longitud y luego los datos, que ya la incluyen
+        length = self.length
+        best, average, worst = self._columns[:3, :length]
+        generations = np.arange(length)
+        if length <= points:
+            return generations, best, average, worst
+
+        starts = np.linspace(0, length, points, endpoint=False).astype(np.intp)
+        sizes = np.diff(np.append(starts, length))
+        return (
+            generations[starts],
+            np.maximum.reduceat(best, starts),
+            np.add.reduceat(average, starts) / sizes,
+            np.minimum.reduceat(worst, starts),
+        )
+
+    def columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return self.best, self.average, self.worst, self.diversity
+
+    def __len__(self) -> int:
+        return self.length
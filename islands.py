@@ -0,0 +1,184 @@
+from algorithm import ComputerGenerator, IndexedComputerGenerator
+from catalog import Catalog, default_catalog
+from models import Computer, UserPreferences
+import multiprocessing
+import numpy as np
+import random
+import traceback
+
+
+class IslandComputerGenerator:
+    """
+        Modelo de islas: corre `islands` poblaciones independientes, cada una en su
+        propio proceso. Cada `migration_interval` generaciones cada isla manda sus
+        `migrants` mejores genomas a otra isla (topología "ring" o "random"), que
+        reemplazan a sus peores individuos. Cada isla usa los operadores de
+        crossover, mutate y pruning del generador indicado en `engine`.
+    """
+
+    def __init__(
+        self,
+        islands: int,
+        population_size: int,
+        crossover_rate: float,
+        mutation_rate: float,
+        generations: int,
+        user_preferences: UserPreferences,
+        migration_interval: int = 10,
+        migrants: int = 2,
+        topology: str = "ring",
+        engine: type[ComputerGenerator] = IndexedComputerGenerator,
+        catalog: Catalog | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.islands: int = islands
+        self.population_size: int = population_size
+        self.crossover_rate: float = crossover_rate
+        self.mutation_rate: float = mutation_rate
+        self.generations: int = generations
+        self.user_preferences: UserPreferences = user_preferences
+        self.migration_interval: int = migration_interval
+        self.migrants: int = migrants
+        self.topology: str = topology
+        self.engine: type[ComputerGenerator] = engine
+        self.catalog: Catalog = catalog or default_catalog()
+        # De esta semilla salen las rutas de migración y la semilla de cada isla
+        self.random: random.Random = random.Random(seed)
+
+        # Historia por isla: mejor, promedio y peor aptitud de cada generación
+        self.island_best_cases: list[np.ndarray] = []
+        self.island_avg_cases: list[np.ndarray] = []
+        self.island_worst_cases: list[np.ndarray] = []
+
+    def migration_routes(self) -> list[list[int]]:
+        """
+            Destino de cada isla en cada migración. Siempre es una permutación sin
+            puntos fijos, así cada isla recibe exactamente un envío por migración.
+        """
+        migrations = (self.generations - 1) // self.migration_interval
+        if self.islands < 2:
+            return []
+
+        match (self.topology):
+            case "ring":
+                ring = [(island + 1) % self.islands for island in range(self.islands)]
+                return [ring for _ in range(migrations)]
+            case "random":
+                routes = []
+                for _ in range(migrations):
+                    route = list(range(self.islands))
+                    while any(target == island for island, target in enumerate(route)):
+                        self.random.shuffle(route)
+                    routes.append(route)
+                return routes
+            case _:
+                raise ValueError(f"Topología desconocida: {self.topology}")
+
+    def run(self) -> Computer:
+        context = multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(self.islands)]
+        results = context.Queue()
+        settings = {
+            "population_size": self.population_size,
+            "crossover_rate": self.crossover_rate,
+            "mutation_rate": self.mutation_rate,
+            "generations": self.generations,
+            "user_preferences": self.user_preferences,
+        }
+        routes = self.migration_routes() if self.migrants > 0 else []
+        seeds = [self.random.getrandbits(64) for _ in range(self.islands)]
+
+        processes = [
+            context.Process(
+                target=_run_island,
+                args=(
+                    island,
+                    self.engine,
+                    {**settings, "seed": seeds[island]},
+                    self.catalog,
+                    self.migration_interval,
+                    self.migrants,
+                    routes,
+                    inboxes,
+                    results,
+                ),
+                daemon=True,
+            )
+            for island in range(self.islands)
+        ]
+        for process in processes:
+            process.start()
+
+        outcomes = {}
+        try:
+            for _ in range(self.islands):
+                island, outcome = results.get()
+                if isinstance(outcome, str):
+                    raise RuntimeError(f"La isla {island} falló:\n{outcome}")
+                outcomes[island] = outcome
+        finally:
+            # Si una isla falló, las demás pueden quedar esperando migrantes
+            if len(outcomes) < self.islands:
+                for process in processes:
+                    process.terminate()
+            for process in processes:
+                process.join()
+
+        self.island_best_cases = [outcomes[island][2][0] for island in range(self.islands)]
+        self.island_avg_cases = [outcomes[island][2][1] for island in range(self.islands)]
+        self.island_worst_cases = [outcomes[island][2][2] for island in range(self.islands)]
+
+        # En orden de isla y no de llegada, para que un empate se resuelva igual
+        genome, fitness, _ = max(
+            (outcomes[island] for island in range(self.islands)), key=lambda outcome: outcome[1]
+        )
+        best_computer = self.catalog.build_computer(genome)
+        best_computer.fitness = fitness
+        return best_computer
+
+    def fitness_history(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return (
+            np.max(self.island_best_cases, axis=0),
+            np.mean(self.island_avg_cases, axis=0),
+            np.min(self.island_worst_cases, axis=0),
+        )
+
+
+def _run_island(
+    island: int,
+    engine: type[ComputerGenerator],
+    settings: dict,
+    catalog: Catalog,
+    migration_interval: int,
+    migrants: int,
+    routes: list[list[int]],
+    inboxes: list,
+    results,
+) -> None:
+    try:
+        generator = engine(catalog=catalog, **settings)
+        generator.generate_initial_population()
+
+        # Con topología "random" cada migración llega de una isla distinta y los
+        # envíos de migraciones seguidas pueden llegar desordenados
+        arrivals = {}
+        for generation in range(1, generator.generations + 1):
+            generator.evolve()
+
+            migration, remainder = divmod(generation, migration_interval)
+            if remainder == 0 and migration <= len(routes):
+                inboxes[routes[migration - 1][island]].put((migration, generator.emigrants(migrants)))
+                while migration not in arrivals:
+                    arrived, genomes = inboxes[island].get()
+                    arrivals[arrived] = genomes
+                generator.immigrate(arrivals.pop(migration))
+
+        best_computer = generator.best_computer()
+        results.put(
+            (
+                island,
+                (catalog.genome_of(best_computer), best_computer.fitness, generator.fitness_history()),
+            )
+        )
+    except Exception:
+        results.put((island, traceback.format_exc()))
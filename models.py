@@ -1,52 +1,46 @@
-from copy import deepcopy
+from dataclasses import dataclass, field, fields
 
-class CPU:
-    def __init__(
-        self,
-        maker: str,
-        model: str,
-        performance: int,
-        price: float,
-        power_consumption: int,
-        has_integrated_graphics: bool = False,
-        integrated_graphics_power: int = 0,
-    ) -> None:
-        self.maker: str = maker
-        self.model: str = model
-        self.performance: int = performance
-        self.price: float = price
-        self.power_consumption: int = power_consumption
-        self.has_integrated_graphics: bool = has_integrated_graphics
-        self.integrated_graphics_power: int = integrated_graphics_power
+
+class Component:
+    """
+        Componente del catálogo. Es inmutable y se compara por identidad, así que
+        todas las computadoras comparten la misma instancia y copiarlo regresa el
+        mismo objeto.
+    """
+
+    __slots__ = ()
+
+    def __copy__(self):
+        return self
 
     def __deepcopy__(self, memo):
-        return CPU(
-            self.maker,
-            self.model,
-            self.performance,
-            self.price,
-            self.power_consumption,
-            self.has_integrated_graphics,
-            self.integrated_graphics_power,
-        )
+        return self
+
+    def arguments(self) -> tuple:
+        # Valores con los que se construyó, en el orden del constructor
+        return tuple(getattr(self, field.name) for field in fields(self) if field.init)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CPU(Component):
+    maker: str
+    model: str
+    performance: int
+    price: float
+    power_consumption: int
+    has_integrated_graphics: bool = False
+    integrated_graphics_power: int = 0
 
     def __str__(self):
         return f"CPU: {self.maker} {self.model}, performance: {self.performance}, Price: ${self.price}"
 
 
-class GPU:
-    def __init__(
-        self, maker: str, price: float, power_consumption: int,power: int
-    ) -> None:
-        self.maker: str = maker
-        self.price: float = price
-        self.power_consumption: int = power_consumption
-        self.power: int = power
-
-    def __deepcopy__(self, memo):
-        return GPU(
-            self.maker, self.price, self.power_consumption,self.power
-        )
+@dataclass(frozen=True, slots=True, eq=False)
+class GPU(Component):
+    maker: str
+    price: float
+    power_consumption: int
+    power: int
 
     def __str__(self):
         return (
@@ -54,72 +48,54 @@ class GPU:
         )
 
 
-class RAM:
-    def __init__(
-        self,
-        maker: str,
-        model: str,
-        capacity: int,
-        frequency: int,
-        type: str,
-        price: float,
-    ) -> None:
-        self.maker: str = maker
-        self.model: str = model
-        self.capacity: int = capacity
-        self.frequency: int = frequency
-        self.type: str = type
-        self.price: float = price
+@dataclass(frozen=True, slots=True, eq=False)
+class RAM(Component):
+    maker: str
+    model: str
+    capacity: int
+    frequency: int
+    type: str
+    price: float
 
     def __str__(self):
         return f"RAM: {self.maker} {self.model}, Capacity: {self.capacity}GB, Frequency: {self.frequency}MHz, Type: {self.type}, Price: ${self.price}"
 
 
-class Storage:
-    def __init__(
-        self, maker: str, model: str, type: str, capacity: float,price: float
-    ) -> None:
-        self.maker: str = maker
-        self.model: str = model
-        self.type: str = type
-        self.capacity: float = capacity
-        self.price: float = price
+@dataclass(frozen=True, slots=True, eq=False)
+class Storage(Component):
+    maker: str
+    model: str
+    type: str
+    capacity: float
+    price: float
 
     def __str__(self):
         return f"Storage: {self.maker} {self.type} {self.capacity}GB, Price: ${self.price}"
 
 
-class Motherboard:
-    def __init__(
-        self,
-        maker: str,
-        model: str,
-        price: float,
-        power_consumption: int,
-        max_ram_capacity: int,
-        max_ram_frequency: int,
-        ram_socket_type: str,
-        compatible_cpus: list[CPU],
-    ) -> None:
-        self.maker: str = maker
-        self.model: str = model
-        self.price: float = price
-        self.max_ram_capacity: int = max_ram_capacity
-        self.max_ram_frequency: int = max_ram_frequency
-        self.ram_socket_type: str = ram_socket_type
-        self.power_consumption = power_consumption
-
-        self.compatible_cpus: list[CPU] = compatible_cpus
+@dataclass(frozen=True, slots=True, eq=False)
+class Motherboard(Component):
+    maker: str
+    model: str
+    price: float
+    power_consumption: int
+    max_ram_capacity: int
+    max_ram_frequency: int
+    ram_socket_type: str
+    # Generaciones de CPU soportadas; en data.py vienen como int (14) o str ("G7")
+    compatible_cpus: tuple[int | str, ...]
+    compatible_cpu_models: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "compatible_cpus", tuple(self.compatible_cpus))
+        object.__setattr__(
+            self,
+            "compatible_cpu_models",
+            frozenset(str(generation) for generation in self.compatible_cpus),
+        )
 
     def is_cpu_compatible(self, cpu: CPU) -> bool:
-        try:
-            compatible: bool = cpu.model in [
-                compatible_cpu.model for compatible_cpu in self.compatible_cpus
-            ]
-            return compatible
-        except Exception:
-            # print(cpu)
-            return False
+        return str(cpu.model) in self.compatible_cpu_models
 
     def is_ram_compatible(self, ram: RAM) -> bool:
         return (
@@ -128,37 +104,24 @@ class Motherboard:
             and ram.capacity <= self.max_ram_capacity
         )
 
-    def __deepcopy__(self, memo):
-        return Motherboard(
-            self.maker,
-            self.model,
-            self.price,
-            self.power_consumption,
-            self.compatible_cpus,
-            self.max_ram_capacity,
-            self.max_ram_frequency,
-            self.ram_socket_type,
-        )
-
     def __str__(self):
         return f"Motherboard: {self.maker} {self.model}, Price: ${self.price}"
 
 
-class PSU:
-    def __init__(self, maker: str, model: str, capacity: int, price: float) -> None:
-        self.maker: str = maker
-        self.model: str = model
-        self.capacity: str = capacity
-        self.price: float = price
-
-    def __deepcopy__(self, memo):
-        return PSU(self.maker, self.model, self.capacity, self.price)
+@dataclass(frozen=True, slots=True, eq=False)
+class PSU(Component):
+    maker: str
+    model: str
+    capacity: int
+    price: float
 
     def __str__(self) -> str:
         return f"PSU: {self.maker} {self.model}, capacity: {self.capacity}W, price: {self.price}"
 
 
 class Computer:
+    __slots__ = ("cpu", "gpu", "ram", "storage", "motherboard", "psu", "price", "fitness")
+
     def __init__(
         self,
         cpu: CPU,
@@ -191,17 +154,19 @@ class Computer:
         return f"Computer Configuration:\n{str(self.cpu)}\n{str(self.gpu)}\n{str(self.ram)}\n{str(self.storage)}\n{str(self.motherboard)}\n{str(self.psu)}\nTotal Price: ${self.price}"
 
     def __deepcopy__(self, memo):
-        new_computer = Computer(
-            deepcopy(self.cpu),
-            deepcopy(self.gpu),
-            deepcopy(self.ram),
-            deepcopy(self.storage),
-            deepcopy(self.motherboard),
-            deepcopy(self.psu),
-        )
+        # Los componentes se comparten, solo se crea la computadora
+        return Computer(self.cpu, self.gpu, self.ram, self.storage, self.motherboard, self.psu)
+
+    @property
+    def key(self) -> tuple:
+        # Dos computadoras son iguales si usan las mismas instancias de componentes
+        return (self.cpu, self.gpu, self.ram, self.storage, self.motherboard, self.psu)
 
-        new_computer.price = self.price
-        return new_computer
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Computer) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
 
     def is_psu_capacity_enough(self) -> bool:
         power_needed = self.cpu.power_consumption + (self.gpu.power_consumption if self.gpu else 0) + self.motherboard.power_consumption + 50
@@ -241,3 +206,12 @@ class UserPreferences:
         self.min_prince: int = min_price
         self.max_price: int = max_price
         self.usage: str = usage
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, UserPreferences) and (
+            (self.min_prince, self.max_price, self.usage)
+            == (other.min_prince, other.max_price, other.usage)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.min_prince, self.max_price, self.usage))
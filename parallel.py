@@ -0,0 +1,38 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from catalog import Catalog
+from fitness import batch_fitness
+from models import UserPreferences
+import numpy as np
+
+# Estado de cada proceso trabajador, se recibe una sola vez al arrancar
+_catalog: Catalog | None = None
+_user_preferences: UserPreferences | None = None
+
+
+def _init_worker(catalog: Catalog, user_preferences: UserPreferences) -> None:
+    global _catalog, _user_preferences
+    _catalog = catalog
+    _user_preferences = user_preferences
+
+
+def _evaluate_chunk(genomes: np.ndarray) -> np.ndarray:
+    return batch_fitness(_catalog, genomes, _user_preferences)
+
+
+def start_worker_pool(
+    workers: int, catalog: Catalog, user_preferences: UserPreferences
+) -> ProcessPoolExecutor:
+    """
+        Crea un pool de procesos que evalúan aptitudes. El catálogo y las
+        preferencias viajan una vez por proceso; cada tarea solo recibe genomas.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(catalog, user_preferences),
+    )
+
+
+def evaluate_in_pool(executor: Executor, genomes: np.ndarray, chunks: int) -> np.ndarray:
+    parts = np.array_split(genomes, chunks)
+    return np.concatenate(list(executor.map(_evaluate_chunk, parts)))
@@ -0,0 +1,34 @@
+from typing import Callable
+import numpy as np
+
+# Recibe las aptitudes de la población, cuántos sobreviven y un generador
+# aleatorio; regresa los índices de los sobrevivientes
+SelectionStrategy = Callable[[np.ndarray, int, np.random.Generator], np.ndarray]
+
+
+def truncation_selection(fitness: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+        Los `count` más aptos, en tiempo lineal y sin ordenar toda la población.
+    """
+    if count >= len(fitness):
+        return np.arange(len(fitness))
+    return np.argpartition(-fitness, count - 1)[:count]
+
+
+def tournament_selection(
+    fitness: np.ndarray, count: int, rng: np.random.Generator, size: int = 2
+) -> np.ndarray:
+    """
+        Cada lugar se lo gana el más apto de `size` individuos al azar. El mejor
+        de la población siempre sobrevive.
+    """
+    contenders = rng.integers(0, len(fitness), (count, size))
+    winners = contenders[np.arange(count), np.argmax(fitness[contenders], axis=1)]
+    winners[0] = np.argmax(fitness)
+    return winners
+
+
+SELECTION_STRATEGIES: dict[str, SelectionStrategy] = {
+    "truncation": truncation_selection,
+    "tournament": tournament_selection,
+}
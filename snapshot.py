@@ -0,0 +1,120 @@
+from catalog import Catalog, data_catalog
+from models import CPU, GPU, PSU, RAM, Motherboard, Storage
+from pathlib import Path
+import hashlib
+import json
+import math
+import mmap
+import numpy as np
+import os
+
+SNAPSHOT_PATH = Path(__file__).with_name("catalog_snapshot")
+
+# Archivos de los que sale el contenido de la instantánea: si cualquiera cambia,
+# se vuelve a generar
+SOURCES = ("data.py", "catalog.py", "models.py")
+
+# Cada columna empieza en un múltiplo de estos bytes dentro de columns.bin
+ALIGNMENT = 64
+
+# Clase de cada lista de componentes, en el orden del genoma
+COMPONENT_TYPES = (CPU, GPU, RAM, Storage, Motherboard, PSU)
+
+
+def source_version() -> str:
+    digest = hashlib.sha256()
+    for source in SOURCES:
+        digest.update(source.encode())
+        digest.update(Path(__file__).with_name(source).read_bytes())
+    return digest.hexdigest()
+
+
+def write_snapshot(catalog: Catalog, directory: Path = SNAPSHOT_PATH) -> None:
+    """
+        Guarda el catálogo de data.py en una carpeta con cuatro archivos:
+        version, con la huella de las fuentes; components.json, con los
+        argumentos de cada componente; columns.bin, con todas las columnas una
+        tras otra; y columns.txt, con una línea por columna (nombre, tipo,
+        posición y forma). Se escribe en una carpeta temporal y luego se
+        reemplaza, para no dejar una a medias.
+    """
+    import shutil
+
+    directory = Path(directory)
+    temporary = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+    shutil.rmtree(temporary, ignore_errors=True)
+    temporary.mkdir()
+
+    layout = []
+    with open(temporary / "columns.bin", "wb") as file:
+        for name, values in catalog.columns().items():
+            file.write(bytes(-file.tell() % ALIGNMENT))
+            layout.append(" ".join([name, values.dtype.str, str(file.tell()), *map(str, values.shape)]))
+            file.write(np.ascontiguousarray(values).tobytes())
+
+    (temporary / "columns.txt").write_text("\n".join(layout), encoding="ascii")
+    components = [
+        [None if component is None else component.arguments() for component in components]
+        for components in catalog.components
+    ]
+    (temporary / "components.json").write_text(json.dumps(components, ensure_ascii=False), encoding="utf-8")
+    (temporary / "version").write_text(source_version(), encoding="ascii")
+
+    shutil.rmtree(directory, ignore_errors=True)
+    temporary.rename(directory)
+
+
+def load_snapshot(directory: Path = SNAPSHOT_PATH) -> Catalog:
+    """
+        Catálogo leído de la instantánea, sin importar data.py ni recalcular las
+        columnas: los componentes se arman con sus argumentos guardados y
+        columns.bin se mapea en memoria de solo lectura, con cada columna como
+        una vista sobre él, así que varios procesos que la cargan comparten las
+        mismas páginas. La huella se revisa antes de leer lo demás; falla con
+        ValueError si las fuentes cambiaron desde que se generó.
+    """
+    directory = Path(directory)
+    if (directory / "version").read_text(encoding="ascii") != source_version():
+        raise ValueError(f"La instantánea del catálogo está desactualizada: {directory}")
+
+    with open(directory / "columns.bin", "rb") as file:
+        data = np.frombuffer(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), dtype=np.uint8)
+    columns = {}
+    for line in (directory / "columns.txt").read_text(encoding="ascii").splitlines():
+        name, dtype, offset, *shape = line.split()
+        dtype = np.dtype(dtype)
+        offset = int(offset)
+        shape = tuple(map(int, shape))
+        size = dtype.itemsize * math.prod(shape)
+        columns[name] = data[offset : offset + size].view(dtype).reshape(shape)
+
+    arguments = json.loads((directory / "components.json").read_text(encoding="utf-8"))
+    components = tuple(
+        [None if values is None else component_type(*values) for values in arguments[gene]]
+        for gene, component_type in enumerate(COMPONENT_TYPES)
+    )
+
+    catalog = Catalog.from_columns(components, columns)
+    catalog.snapshot = directory
+    return catalog
+
+
+def snapshot_catalog(directory: Path = SNAPSHOT_PATH) -> Catalog:
+    """
+        El catálogo de data.py con sus columnas desde la instantánea. Si no existe
+        o está desactualizada se genera de nuevo; si no se puede escribir, se usa
+        el catálogo armado en memoria.
+    """
+    try:
+        return load_snapshot(directory)
+    except (OSError, ValueError):
+        pass
+
+    catalog = data_catalog()
+    try:
+        write_snapshot(catalog, directory)
+    except OSError:
+        return catalog
+
+    catalog.snapshot = Path(directory)
+    return catalog
@@ -0,0 +1,138 @@
+from catalog import CPU_GENE, GENOME_DTYPE, GENOME_LENGTH, GPU_GENE, MOTHERBOARD_GENE, PSU_GENE, RAM_GENE, STORAGE_GENE, Catalog, default_catalog
+from fitness import batch_fitness, usage_masks
+from models import Computer, UserPreferences
+import numpy as np
+
+
+class BranchAndBoundSolver:
+    """
+        Motor exacto con el mismo contrato que ComputerGenerator.run(). Ramifica
+        sobre (motherboard, cpu, gpu) en orden de su cota optimista de aptitud y
+        resuelve de forma exacta la mejor (ram, storage, psu) de cada rama. Se
+        detiene cuando la cota de la siguiente rama ya no supera a la mejor
+        computadora encontrada, así que el resultado es el óptimo global.
+    """
+
+    def __init__(self, user_preferences: UserPreferences, catalog: Catalog | None = None) -> None:
+        self.user_preferences: UserPreferences = user_preferences
+        self.catalog: Catalog = catalog or default_catalog()
+
+        # Estadísticas de la última búsqueda
+        self.branches: int = 0
+        self.explored_branches: int = 0
+
+    def upper_bounds(self) -> np.ndarray:
+        """
+            Cota superior de la aptitud para cada rama (motherboard, cpu, gpu),
+            suponiendo que la ram, el storage y la psu cumplen todo lo que todavía
+            es alcanzable con esa rama.
+        """
+        catalog = self.catalog
+        preferences = self.user_preferences
+        cpu_gpu_usage, ram_usage, storage_usage = usage_masks(catalog, preferences.usage)
+
+        bottleneck = 10 * (catalog.cpu_performance[:, None] - catalog.gpu_power[None, :] <= 20)
+        usage = 30 * (cpu_gpu_usage & ram_usage.any() & storage_usage.any())
+        compatible = 30 * (
+            catalog.cpu_compatibility & catalog.ram_compatibility.any(axis=1)[:, None]
+        )
+
+        power_needed = (
+            catalog.motherboard_power_consumption[:, None, None]
+            + catalog.cpu_power_consumption[None, :, None]
+            + catalog.gpu_power_consumption[None, None, :]
+            + 50
+        )
+        capacities = np.sort(catalog.psu_capacity)
+        # La psu más chica que sobrepasa lo necesario, si no se pasa por más de 50
+        smallest = np.searchsorted(capacities, power_needed, side="right")
+        psu_enough = 10 * (
+            (smallest < len(capacities))
+            & (capacities[np.minimum(smallest, len(capacities) - 1)] - power_needed <= 50)
+        )
+
+        fixed_price = (
+            catalog.motherboard_price[:, None, None]
+            + catalog.cpu_price[None, :, None]
+            + catalog.gpu_price[None, None, :]
+        )
+        cheapest = fixed_price + catalog.ram_price.min() + catalog.storage_price.min() + catalog.psu_price.min()
+        priciest = fixed_price + catalog.ram_price.max() + catalog.storage_price.max() + catalog.psu_price.max()
+        price = 30 * ((cheapest <= preferences.max_price) & (priciest >= preferences.min_prince))
+
+        # Los puntos enteros primero y luego las relaciones calidad/precio, en el
+        # mismo orden que fitness_function, para que el redondeo no baje la cota
+        points = price + compatible[:, :, None] + usage[None, :, :] + psu_enough + bottleneck[None, :, :]
+        return points + catalog.cpu_quality[None, :, None] + catalog.gpu_quality[None, None, :]
+
+    def solve_branch(self, motherboard: int, cpu: int, gpu: int) -> tuple[float, int, int, int]:
+        """
+            Mejor (ram, storage, psu) para una rama. Regresa la aptitud de la
+            computadora completa y los índices elegidos.
+        """
+        catalog = self.catalog
+        preferences = self.user_preferences
+        cpu_gpu_usage, ram_usage, storage_usage = usage_masks(catalog, preferences.usage)
+
+        # Mismo orden de suma que Computer.price
+        price = (
+            (catalog.cpu_price[cpu] + catalog.gpu_price[gpu] + catalog.ram_price)[:, None]
+            + catalog.storage_price[None, :]
+            + catalog.motherboard_price[motherboard]
+        )[:, :, None] + catalog.psu_price[None, None, :]
+        within_price_range = (preferences.min_prince <= price) & (price <= preferences.max_price)
+
+        compatible = catalog.cpu_compatibility[motherboard, cpu] & catalog.ram_compatibility[motherboard]
+        usage = cpu_gpu_usage[cpu, gpu] & ram_usage[:, None] & storage_usage[None, :]
+
+        power_needed = (
+            catalog.cpu_power_consumption[cpu]
+            + catalog.gpu_power_consumption[gpu]
+            + catalog.motherboard_power_consumption[motherboard]
+            + 50
+        )
+        capacity = catalog.psu_capacity
+        psu_enough = (power_needed < capacity) & (capacity - power_needed <= 50)
+
+        score = (
+            30 * within_price_range
+            + (30 * compatible[:, None] + 30 * usage)[:, :, None]
+            + (10 * psu_enough)[None, None, :]
+        )
+        ram, storage, psu = np.unravel_index(np.argmax(score), score.shape)
+
+        genome = np.empty((1, GENOME_LENGTH), dtype=GENOME_DTYPE)
+        genome[0, CPU_GENE] = cpu
+        genome[0, GPU_GENE] = gpu
+        genome[0, RAM_GENE] = ram
+        genome[0, STORAGE_GENE] = storage
+        genome[0, MOTHERBOARD_GENE] = motherboard
+        genome[0, PSU_GENE] = psu
+
+        return float(batch_fitness(catalog, genome, preferences)[0]), int(ram), int(storage), int(psu)
+
+    def run(self) -> Computer:
+        bounds = self.upper_bounds()
+        order = np.argsort(-bounds, axis=None, kind="stable")
+        sorted_bounds = bounds.ravel()[order]
+
+        self.branches = len(order)
+        self.explored_branches = 0
+
+        best_fitness = -np.inf
+        best_genome = None
+        for branch, bound in zip(order.tolist(), sorted_bounds.tolist()):
+            if bound <= best_fitness:
+                break
+
+            motherboard, cpu, gpu = np.unravel_index(branch, bounds.shape)
+            fitness, ram, storage, psu = self.solve_branch(int(motherboard), int(cpu), int(gpu))
+            self.explored_branches += 1
+
+            if fitness > best_fitness:
+                best_fitness = fitness
+                best_genome = (cpu, gpu, ram, storage, motherboard, psu)
+
+        best_computer = self.catalog.build_computer(best_genome)
+        best_computer.fitness = best_fitness
+        return best_computer
@@ -0,0 +1,53 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Iterator
+import numpy as np
+import time
+
+# Recibe el número de generación (0 = población inicial) y los segundos que tomó
+# cada fase en esa generación
+PhaseCallback = Callable[[int, dict[str, float]], None]
+
+
+class PhaseTimer:
+    """
+        Mide cuánto tarda cada fase del algoritmo (población inicial, cruza,
+        mutación, evaluación, estadísticas, selección...). Guarda el total por fase
+        y el desglose de cada generación; con `callback` lo emite al cerrar cada
+        generación. Solo hay una medición por fase y generación, así que el costo
+        no depende del tamaño de la población.
+    """
+
+    def __init__(self, callback: PhaseCallback | None = None) -> None:
+        self.callback: PhaseCallback | None = callback
+        self.totals: defaultdict[str, float] = defaultdict(float)
+        self.generations: list[dict[str, float]] = []
+        self._current: defaultdict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.totals[name] += elapsed
+            self._current[name] += elapsed
+
+    def end_generation(self) -> None:
+        durations = dict(self._current)
+        self.generations.append(durations)
+        self._current.clear()
+        if self.callback is not None:
+            self.callback(len(self.generations) - 1, durations)
+
+    def per_generation(self, name: str) -> np.ndarray:
+        """
+            Segundos de la fase `name` en cada generación (0 si no ocurrió).
+        """
+        return np.array([durations.get(name, 0.0) for durations in self.generations])
+
+    def reset(self) -> None:
+        self.totals.clear()
+        self.generations.clear()
+        self._current.clear()